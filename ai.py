@@ -3,41 +3,784 @@ AI player module implementing the Minimax algorithm with alpha-beta pruning.
 This module provides the AI logic for making moves in the Connect Four game.
 """
 
-import random
+import json
 import math
-import numpy as np
+import os
+import random
+import threading
+import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from transposition import TranspositionTable, EXACT, LOWER_BOUND, UPPER_BOUND
+from solver import Solver, SolverTimeout
+from opening_book import DEFAULT_BOOK_PATH, load_book
+from parallel_search import get_pool
+
+# Mixed into the Zobrist hash so the same position is cached separately per side to move
+MINIMIZER_KEY = 0x9E3779B97F4A7C15
+
+# Mixed into the Zobrist hash per searching piece: scores are from the searching
+# player's point of view, so players of both pieces sharing a table must not see
+# each other's entries
+PIECE_KEYS = {1: 0xD1B54A32D192ED03, 2: 0x8CB92BA72F3D8DD7}
+
+# Score of a won position; any score this large is a forced result
+WIN_SCORE = 1000000
+
+# Search budget per difficulty level: depth cap, per-move time limit in seconds
+# and optional per-move node budget. A node budget keeps the cost of a move the
+# same whether seven columns are open or two, where a fixed depth does not: the
+# search only starts an iteration it expects to finish within the budget.
+# "randomness" is the chance of playing a random legal move instead of searching,
+# "book" levels play from the opening book while the position is in it,
+# "exact" levels try to solve the position outright before falling back to the
+# heuristic search (in pure Python the solver usually finishes within the budget
+# only from about move 16 on, so earlier moves are exact only from the book), "parallel" levels split the root moves across processes and
+# "ponder" levels think on the opponent's time. No level is parallel by default:
+# the root split searches the best move alone first, which bounds its gain to
+# about 1.2x on two cores and 1.3x on four on the bench suite, before the cost
+# of starting the pool and passing positions to it.
+DIFFICULTY_SETTINGS = {
+    "easy": {"max_depth": 42, "time_limit": 0.5, "node_limit": 100, "randomness": 0.2},
+    "medium": {"max_depth": 42, "time_limit": 0.5, "node_limit": 600, "randomness": 0.05},
+    "hard": {"max_depth": 42, "time_limit": 1.0, "book": True, "ponder": True},
+    "perfect": {"max_depth": 42, "time_limit": 3.0, "book": True, "exact": True, "ponder": True},
+}
+
+# Settings a difficulty level may define, with their types
+DIFFICULTY_OPTIONS = {
+    "max_depth": int,
+    "time_limit": float,
+    "node_limit": int,
+    "randomness": float,
+    "book": bool,
+    "exact": bool,
+    "parallel": bool,
+    "ponder": bool,
+}
+
+# Settings file read at import time, if present, to override DIFFICULTY_SETTINGS;
+# found next to this module whatever the working directory
+DIFFICULTY_SETTINGS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "ai_settings.json")
+
+# Share of an exact level's time budget given to the solver
+SOLVER_TIME_SHARE = 0.75
+
+# Least share of the time budget left for a move whose ponder search was cut off too shallow
+PONDER_MIN_SHARE = 0.5
+
+# Number of nodes searched between two deadline and cancellation checks
+# (must be 2^n - 1)
+DEADLINE_CHECK_INTERVAL = 255
+
+# Shallowest iteration worth splitting across worker processes
+PARALLEL_MIN_DEPTH = 4
+
+# Background thread that runs searches requested with get_move_async, one at a time
+_search_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ai-search")
+
+def load_difficulty_settings(path=DIFFICULTY_SETTINGS_PATH):
+    """
+    Read difficulty profiles from a JSON settings file into DIFFICULTY_SETTINGS.
+    The file maps level names to settings, for example
+    {"medium": {"node_limit": 5000, "randomness": 0}}. Settings of an existing
+    level replace only the keys given; a new level starts from the "hard" profile.
+    Nothing is changed unless the whole file is valid.
+    
+    Args:
+        path (str): Path of the settings file
+        
+    Returns:
+        dict: The updated DIFFICULTY_SETTINGS
+        
+    Raises:
+        ValueError: If the file is not a JSON object of levels or names an unknown setting
+    """
+    with open(path, "r") as file:
+        try:
+            levels = json.load(file)
+        except json.JSONDecodeError as error:
+            raise ValueError(f"{path}: {error}") from None
+    if not isinstance(levels, dict):
+        raise ValueError(f"{path}: expected an object of difficulty levels")
+    updated = dict(DIFFICULTY_SETTINGS)
+    for level, options in levels.items():
+        if not isinstance(options, dict):
+            raise ValueError(f"{path}: settings of {level} must be an object")
+        settings = dict(updated.get(level, updated["hard"]))
+        for key, value in options.items():
+            if key not in DIFFICULTY_OPTIONS:
+                raise ValueError(f"{path}: unknown setting {key} for {level}")
+            if value is None:
+                settings.pop(key, None)
+                continue
+            try:
+                settings[key] = DIFFICULTY_OPTIONS[key](value)
+            except (TypeError, ValueError):
+                raise ValueError(f"{path}: invalid value {value!r} for {key} of {level}") from None
+        updated[level] = settings
+    DIFFICULTY_SETTINGS.update(updated)
+    return DIFFICULTY_SETTINGS
+
+if os.path.exists(DIFFICULTY_SETTINGS_PATH):
+    try:
+        load_difficulty_settings()
+    except (OSError, ValueError) as error:
+        # A broken settings file must not stop the game from starting
+        warnings.warn(f"Ignoring difficulty settings: {error}")
+
+class SearchTimeout(Exception):
+    """
+    Raised inside the search when the move deadline has passed or the search
+    has been cancelled.
+    """
+
+class CancellationToken:
+    """
+    Flag that asks a running search to stop early. Safe to set from any thread.
+    """
+    
+    def __init__(self):
+        self._event = threading.Event()
+    
+    def cancel(self):
+        """
+        Ask the searches holding this token to stop.
+        """
+        self._event.set()
+    
+    @property
+    def cancelled(self):
+        """
+        Whether cancel() has been called.
+        
+        Returns:
+            bool: True once the token is cancelled
+        """
+        return self._event.is_set()
+
+class SearchStats:
+    """
+    Counters describing the work done for the last move.
+    Node counts, depth, time and transposition-table traffic are always
+    recorded; the per-node counters (leaf evaluations, cutoffs and the
+    deepest ply) are only collected by players created with collect_stats=True.
+    """
+    
+    def __init__(self):
+        self.nodes = 0
+        self.depth = 0               # Deepest fully completed iteration
+        self.iteration_nodes = []    # Nodes searched by each completed iteration
+        self.elapsed = 0.0           # Seconds spent on the move
+        self.tt_hits = 0             # Transposition-table probes that found their position
+        self.tt_stores = 0           # Transposition-table stores
+        self.leaf_evals = 0          # Heuristic evaluations at the depth horizon
+        self.max_ply = 0             # Deepest ply visited
+        self.cutoffs = 0             # Nodes where a beta cutoff ended the move loop
+        self.first_move_cutoffs = 0  # Cutoffs produced by the first move searched
+        self.cutoffs_by_ply = []     # Cutoffs counted per distance from the root
+    
+    @property
+    def nodes_per_second(self):
+        """
+        Search speed over the whole move.
+        
+        Returns:
+            float: Nodes per second (0 if no time was measured)
+        """
+        return self.nodes / self.elapsed if self.elapsed > 0 else 0.0
+    
+    @property
+    def branching_factor(self):
+        """
+        Effective branching factor: how many times more nodes the last
+        iteration needed than the one before it.
+        
+        Returns:
+            float: Ratio of the last two iterations' node counts (0 with fewer than two iterations)
+        """
+        if len(self.iteration_nodes) < 2 or not self.iteration_nodes[-2]:
+            return 0.0
+        return self.iteration_nodes[-1] / self.iteration_nodes[-2]
+    
+    @property
+    def cutoff_rate(self):
+        """
+        Share of cutoffs found on the first move, a measure of move-ordering quality.
+        
+        Returns:
+            float: Value between 0 and 1 (0 when there were no cutoffs)
+        """
+        return self.first_move_cutoffs / self.cutoffs if self.cutoffs else 0.0
+    
+    def summary(self):
+        """
+        One-line description of the statistics for logs.
+        
+        Returns:
+            str: Human-readable summary
+        """
+        return (f"{self.nodes} nodes, depth {self.depth}, {self.elapsed * 1000:.1f} ms, "
+                f"{self.nodes_per_second:.0f} nps, {self.tt_hits} TT hits, "
+                f"branching factor {self.branching_factor:.2f}")
+    
+    def merge(self, other):
+        """
+        Add the counters of another search of the same move, such as one
+        worker task of a parallel search. Depth, time and per-iteration
+        counts describe the whole move and are left to its owner.
+        
+        Args:
+            other (SearchStats): Statistics to add
+        """
+        self.nodes += other.nodes
+        self.tt_hits += other.tt_hits
+        self.tt_stores += other.tt_stores
+        self.leaf_evals += other.leaf_evals
+        self.max_ply = max(self.max_ply, other.max_ply)
+        self.cutoffs += other.cutoffs
+        self.first_move_cutoffs += other.first_move_cutoffs
+        by_ply = self.cutoffs_by_ply
+        if len(by_ply) < len(other.cutoffs_by_ply):
+            by_ply.extend([0] * (len(other.cutoffs_by_ply) - len(by_ply)))
+        for ply, count in enumerate(other.cutoffs_by_ply):
+            by_ply[ply] += count
+
+def center_order(columns):
+    """
+    Columns ordered from the center outwards, the static move-ordering baseline.
+    
+    Args:
+        columns (int): Number of columns in the board
+        
+    Returns:
+        tuple: Column indices, center first
+    """
+    order = _CENTER_ORDERS.get(columns)
+    if order is None:
+        order = tuple(sorted(range(columns), key=lambda c: abs(2 * c - (columns - 1))))
+        _CENTER_ORDERS[columns] = order
+    return order
+
+_CENTER_ORDERS = {}
 
 class AIPlayer:
     """
     AI player class that uses the Minimax algorithm to determine optimal moves.
-    Supports different difficulty levels by adjusting the search depth.
+    Supports different difficulty levels by adjusting the search budget.
     """
     
-    def __init__(self, difficulty):
+    # True if select_move may pick any of several equally good root moves, which
+    # then all need exact scores rather than the bounds alpha-beta settles for
+    random_ties = False
+    
+    def __init__(self, difficulty, tt_size_mb=16, time_limit=None, piece=2, book_path=DEFAULT_BOOK_PATH,
+                 workers=None, node_limit=None, collect_stats=False):
         """
         Initialize the AI player with a specified difficulty level.
         
         Args:
-            difficulty (str): AI difficulty level ("easy", "medium", or "hard")
+            difficulty (str): AI difficulty level ("easy", "medium", "hard", "perfect"
+                or a level added by the settings file)
+            tt_size_mb (float): Memory cap for the transposition table in megabytes
+            time_limit (float): Per-move time budget in seconds, overriding the difficulty default
+            piece (int): Piece this player moves with (default: 2, the AI piece)
+            book_path (str): Opening book file consulted by book levels, or None to disable
+            workers (int): Worker processes for parallel levels (default: one per CPU, 1 to disable)
+            node_limit (int): Per-move node budget, overriding the difficulty default
+            collect_stats (bool): Also collect the per-node counters of SearchStats,
+                which slows the search slightly
         """
         self.difficulty = difficulty
+        self.time_limit = time_limit
+        self.node_limit = node_limit
+        self.piece = piece
+        self.book_path = book_path
+        self.workers = workers
+        self.tt_size_mb = tt_size_mb
+        self.opp_piece = 1 if piece == 2 else 2
+        self._piece_key = PIECE_KEYS[piece]
+        self.solver = None  # Created on first use by exact difficulty levels
+        self.solved_score = None  # Game-theoretic score of the last solved position
+        # (position hash, move, seconds spent, depth reached, completed) of the last ponder search, or None
+        self.ponder_result = None
+        self.move_depth = None  # Depth the last timed search reached, to judge pondered moves by
+        # Kept for the lifetime of the player so later moves of a game start warm
+        self.tt = TranspositionTable(tt_size_mb)
+        self.nodes = 0  # Nodes searched for the last move, including worker processes
+        self.last_depth = 0  # Deepest fully completed iteration of the last search
+        self.collect_stats = collect_stats
+        self.stats = SearchStats()  # Statistics of the running or last search
+        self.last_stats = SearchStats()  # Statistics of the last move returned by get_move
+        self.cancelled = False  # True if the last search was stopped by its cancellation token
+        self._deadline = None
+        self._cancel = None
+        self._stats = None  # self.stats while collect_stats is on, else None
+        # Move-ordering state: two killer moves per ply and a history score per (piece, cell)
+        self.killers = []
+        self.history = [None, {}, {}]
     
-    def get_move(self, board):
+    def get_move(self, board, cancel=None, node_limit=None):
         """
         Determine the next move based on the current board state and difficulty level.
+        A cancelled search stops promptly and returns the best move found so
+        far; self.cancelled reports whether that happened. self.last_stats
+        describes the work done for the move.
         
         Args:
             board (Board): Current game board state
+            cancel (CancellationToken): Token that stops the search early, or None
+            node_limit (int): Stop searching after about this many nodes
+                (default: the player's or the difficulty level's node budget)
             
         Returns:
             int: Column index for the AI's move
         """
-        if self.difficulty == "easy":
-            return self.minimax_move(board, depth=1)
-        elif self.difficulty == "medium":
-            return self.minimax_move(board, depth=3)
-        else:  # hard
-            return self.minimax_move(board, depth=5)
+        start = time.perf_counter()
+        tt_hits, tt_stores = self.tt.hits, self.tt.stores
+        self.nodes = 0
+        self.last_depth = 0
+        self.cancelled = False
+        self.stats = SearchStats()  # Replaced by the search's own if one runs
+        col = self._choose_move(board, cancel, node_limit)
+        stats = self.stats
+        stats.nodes = self.nodes
+        stats.depth = self.last_depth
+        stats.elapsed = time.perf_counter() - start
+        # Added to the shared-table traffic of any parallel search
+        stats.tt_hits += self.tt.hits - tt_hits
+        stats.tt_stores += self.tt.stores - tt_stores
+        self.last_stats = stats
+        return col
+    
+    def _choose_move(self, board, cancel, node_limit):
+        """
+        Pick the move for get_move: a deliberate random move, a pondered move
+        or a new search.
+        
+        Args:
+            board (Board): Current game board state
+            cancel (CancellationToken): Token that stops the search early, or None
+            node_limit (int): Node budget requested by the caller, or None
+            
+        Returns:
+            int: Column index for the AI's move
+        """
+        settings = DIFFICULTY_SETTINGS.get(self.difficulty, DIFFICULTY_SETTINGS["hard"])
+        time_limit = self.time_limit if self.time_limit is not None else settings["time_limit"]
+        if node_limit is None:
+            node_limit = self.node_limit if self.node_limit is not None else settings.get("node_limit")
+        randomness = settings.get("randomness")
+        if randomness and random.random() < randomness:
+            # Deliberate mistakes for the weaker levels, but never when a move wins or must block
+            valid = board.get_valid_locations()
+            if valid and not self.immediate_wins(board, self.piece) and not self.immediate_wins(board, self.opp_piece):
+                self.ponder_result = None
+                return random.choice(valid)
+        pondered, self.ponder_result = self.ponder_result, None
+        if pondered is not None and pondered[0] == board.hash and board.is_valid_location(pondered[1]):
+            # The opponent played the predicted move: the position has been searched already
+            _, col, spent, depth, completed = pondered
+            expected = self.move_depth if self.move_depth is not None else settings["max_depth"]
+            if completed or depth >= expected:
+                self.last_depth = depth
+                return col
+            # Cut off shallower than a normal move: search again, quickly through the warm table
+            time_limit = max(time_limit - spent, time_limit * PONDER_MIN_SHARE)
+        col = self.think(board, settings, time_limit, cancel, node_limit)
+        if self.last_depth and not self.cancelled:
+            self.move_depth = self.last_depth
+        return col
+    
+    def immediate_wins(self, board, piece):
+        """
+        Find the moves that would win at once for a piece.
+        
+        Args:
+            board (Board): Current game board state
+            piece (int): Piece to check the winning moves of
+            
+        Returns:
+            list: Columns where the piece completes four in a row
+        """
+        wins = []
+        for col in board.get_valid_locations():
+            board.play(col, piece)
+            if board.winning_move(piece):
+                wins.append(col)
+            board.undo()
+        return wins
+    
+    def think(self, board, settings, time_limit, cancel=None, node_limit=None):
+        """
+        Choose a move with the methods enabled by a difficulty level: the
+        opening book, then the exact solver, then iterative deepening.
+        
+        Args:
+            board (Board): Current game board state
+            settings (dict): Difficulty settings from DIFFICULTY_SETTINGS
+            time_limit (float): Wall-clock budget for the move in seconds
+            cancel (CancellationToken): Token that stops the search early, or None
+            node_limit (int): Stop searching after about this many nodes, or None
+            
+        Returns:
+            int: Column index for the AI's move
+        """
+        if settings.get("book"):
+            col = self.book_move(board, settings.get("exact", False))
+            if col is not None:
+                return col
+        pool = self.search_pool() if settings.get("parallel") else None
+        if settings.get("exact"):
+            col = self.solve_move(board, time_limit * SOLVER_TIME_SHARE, pool, cancel)
+            if col is not None:
+                return col
+            time_limit *= 1 - SOLVER_TIME_SHARE
+        return self.iterative_deepening(board, settings["max_depth"], time_limit, pool, cancel, node_limit)
+    
+    def search_pool(self):
+        """
+        Get the shared worker pool for parallel searches.
+        
+        Returns:
+            RootSearchPool: The pool, or None if only one worker is configured
+        """
+        workers = self.workers if self.workers is not None else os.cpu_count() or 1
+        if workers <= 1:
+            return None
+        return get_pool(workers, self.tt_size_mb)
+    
+    def get_move_async(self, board, cancel=None):
+        """
+        Start computing the next move on the background search thread, so the
+        caller's event loop keeps running during the search.
+        
+        Args:
+            board (Board): Current game board state; a copy is searched, so the
+                caller may keep using the board while the search runs
+            cancel (CancellationToken): Token that stops the search early, or None
+                
+        Returns:
+            concurrent.futures.Future: Resolves to the column index of the move
+        """
+        return _search_executor.submit(self.get_move, board.copy(), cancel)
+    
+    def predict_reply(self, board):
+        """
+        Guess the opponent's next move from the last search's principal variation.
+        
+        Args:
+            board (Board): Position with the opponent to move
+            
+        Returns:
+            int: Predicted column, or None if the board is full
+        """
+        # Positions after the AI's move are minimizing nodes of its search
+        key = board.hash ^ self._piece_key ^ MINIMIZER_KEY
+        entry = self.tt.probe(key)
+        if entry is None or entry[4] is None:
+            # Parallel searches store below the root in the workers' shared table
+            settings = DIFFICULTY_SETTINGS.get(self.difficulty, DIFFICULTY_SETTINGS["hard"])
+            pool = self.search_pool() if settings.get("parallel") else None
+            if pool is not None:
+                entry = pool.table.probe(key)
+        if entry is not None and entry[4] is not None and board.is_valid_location(entry[4]):
+            return entry[4]
+        for col in center_order(board.columns):
+            if board.is_valid_location(col):
+                return col
+        return None
+    
+    def ponder(self, board, cancel):
+        """
+        Think on the opponent's time: search the position after the predicted
+        reply until cancelled or finished. get_move returns the result at once
+        if the prediction comes true; otherwise the search still leaves the
+        transposition table warm.
+        
+        Args:
+            board (Board): Position with the opponent to move
+            cancel (CancellationToken): Token that ends the ponder search
+        """
+        settings = DIFFICULTY_SETTINGS.get(self.difficulty, DIFFICULTY_SETTINGS["hard"])
+        self.ponder_result = None
+        if not settings.get("ponder") or board.is_terminal_node():
+            return
+        reply = self.predict_reply(board)
+        if reply is None:
+            return
+        board = board.copy()
+        board.play(reply, self.opp_piece)
+        if board.is_terminal_node():
+            return
+        start = time.perf_counter()
+        self.last_depth = 0
+        self.solved_score = None
+        col = self.think(board, settings, math.inf, cancel)
+        # Book and solver moves are final even if the search was cancelled afterwards
+        completed = not cancel.cancelled or self.solved_score is not None
+        if col is not None:
+            self.ponder_result = (board.hash, col, time.perf_counter() - start, self.last_depth, completed)
+    
+    def ponder_async(self, board, cancel):
+        """
+        Start pondering on the background search thread. A move requested with
+        get_move_async afterwards runs once the ponder search has been cancelled
+        and has stored its result.
+        
+        Args:
+            board (Board): Position with the opponent to move; a copy is searched
+            cancel (CancellationToken): Token that ends the ponder search
+            
+        Returns:
+            concurrent.futures.Future: Resolves to None when pondering ends
+        """
+        return _search_executor.submit(self.ponder, board.copy(), cancel)
+    
+    def book_move(self, board, exact=False):
+        """
+        Look up the current position in the opening book.
+        
+        Args:
+            board (Board): Current game board state
+            exact (bool): Only accept entries the book builder solved exactly,
+                not ones it fell back to the heuristic search for
+            
+        Returns:
+            int: Book column index, or None if there is no book or no acceptable entry
+        """
+        book = load_book(self.book_path) if self.book_path else None
+        if book is None:
+            return None
+        entry = book.lookup(board, self.piece)
+        if entry is None or not board.is_valid_location(entry[0]):
+            return None
+        col, score, solved = entry
+        if exact and not solved:
+            return None
+        self.solved_score = score if solved else None
+        return col
+    
+    def solve_move(self, board, time_limit=None, pool=None, cancel=None):
+        """
+        Find a perfect-play move with the exact solver.
+        
+        Args:
+            board (Board): Current game board state
+            time_limit (float): Seconds allowed for solving, or None for no limit
+            pool (RootSearchPool): Worker pool to solve the root moves in, or None to solve here
+            cancel (CancellationToken): Token that stops the solver early, or None
+            
+        Returns:
+            int: Optimal column index, or None if the position was not solved in time
+        """
+        if self.solver is None:
+            self.solver = Solver(board.rows, board.columns)
+        win = self.solver.winning_move(board, self.piece)
+        if win is not None:
+            col, self.solved_score = win
+            return col
+        deadline = time.perf_counter() + time_limit if time_limit is not None else None
+        if pool is not None:
+            return self.parallel_solve(board, deadline, pool, cancel)
+        try:
+            col, self.solved_score = self.solver.best_move(board, self.piece, deadline, cancel)
+        except SolverTimeout:
+            self.solved_score = None
+            return None
+        return col
+    
+    def parallel_solve(self, board, deadline, pool, cancel=None):
+        """
+        Solve each root move in a separate worker process.
+        Ties go to the move nearest the center, as in Solver.best_move.
+        
+        Args:
+            board (Board): Current game board state
+            deadline (float): time.perf_counter() value to give up at, or None
+            pool (RootSearchPool): Worker pool to solve in
+            cancel (CancellationToken): Token that stops the solver early, or None
+            
+        Returns:
+            int: Optimal column index, or None if the position was not solved in time
+        """
+        columns = [c for c in center_order(board.columns) if board.is_valid_location(c)]
+        current, mask, _ = self.solver.position(board, self.piece)
+        if self.solver.is_symmetric(current, mask):
+            # Mirrored moves score the same; keep the first of each pair
+            columns = [c for c in columns if c <= (board.columns - 1) // 2]
+        scores = pool.solve(board, self.piece, columns, deadline, cancel)
+        if scores is None:
+            self.solved_score = None
+            return None
+        self.solved_score = max(scores)
+        return columns[scores.index(self.solved_score)]
+    
+    def iterative_deepening(self, board, max_depth, time_limit, pool=None, cancel=None, node_limit=None):
+        """
+        Search one ply deeper at a time until the depth cap or the time budget
+        is reached, the next iteration would not fit in the node budget, or the
+        search is cancelled.
+        Each iteration starts from the previous iteration's best move, which the
+        transposition table keeps for the root position.
+        
+        Args:
+            board (Board): Current game board state
+            max_depth (int): Deepest iteration to run
+            time_limit (float): Wall-clock budget for the move in seconds
+            pool (RootSearchPool): Worker pool for deeper iterations, or None to search here
+            cancel (CancellationToken): Token that stops the search early, or None
+            node_limit (int): Node budget of the completed iterations, or None
+            
+        Returns:
+            int: Column index of the best move from the last completed iteration
+        """
+        start = time.perf_counter()
+        # Search on a private copy; the caller's board is never touched
+        board = board.copy()
+        max_depth = min(max_depth, board.rows * board.columns - board.move_count)
+        best_col = None
+        self.new_search(board)
+        if pool is not None:
+            pool.new_search()
+        try:
+            for depth in range(1, max(max_depth, 1) + 1):
+                # The first iteration always completes so there is a move to return
+                if depth > 1:
+                    self._deadline = start + time_limit
+                    self._cancel = cancel
+                nodes = self.nodes
+                if pool is not None and depth >= PARALLEL_MIN_DEPTH:
+                    col, score = self.parallel_root_search(board, depth, pool)
+                else:
+                    col, score = self.minimax(board, depth, -math.inf, math.inf, True)
+                best_col = col
+                self.last_depth = depth
+                self.stats.iteration_nodes.append(self.nodes - nodes)
+                elapsed = time.perf_counter() - start
+                # Stop on a forced result, or when the next iteration cannot finish in time
+                if abs(score) >= WIN_SCORE or elapsed > time_limit / 2:
+                    break
+                if node_limit is not None:
+                    # Only start an iteration that is expected to finish within the node budget
+                    growth = self.stats.branching_factor or len(board.get_valid_locations())
+                    if self.nodes + self.stats.iteration_nodes[-1] * growth > node_limit:
+                        break
+        except SearchTimeout:
+            self.cancelled = cancel is not None and cancel.cancelled
+        finally:
+            self._deadline = None
+            self._cancel = None
+            self.stats.nodes = self.nodes
+            self.stats.depth = self.last_depth
+            self.stats.elapsed = time.perf_counter() - start
+        return best_col
+    
+    def parallel_root_search(self, board, depth, pool):
+        """
+        Search the root moves in parallel, one worker task per move.
+        Moves are ordered as the serial search would order them, and ties go
+        to select_move in that order, so the result does not depend on which
+        worker finished first. The workers search just below the best score
+        so far, so tied scores are exact.
+        
+        Args:
+            board (Board): Current game board state
+            depth (int): Search depth
+            pool (RootSearchPool): Worker pool to search in
+            
+        Returns:
+            tuple: (column index, score) for the best move
+            
+        Raises:
+            SearchTimeout: If the deadline passed before every move was searched
+        """
+        entry = self.tt.probe(board.hash ^ self._piece_key)
+        tt_move = entry[4] if entry is not None else None
+        columns = self.order_moves(board, tt_move, 0, self.piece)
+        scores, stats = pool.search(board, self.piece, columns, depth, self._deadline, self._cancel,
+                                    self.collect_stats)
+        # The workers' nodes and shared-table traffic count towards this move
+        self.nodes += stats.nodes
+        self.stats.merge(stats)
+        if scores is None:
+            raise SearchTimeout()
+        value = max(scores)
+        col = self.select_move([c for c, score in zip(columns, scores) if score == value])
+        self.tt.store(board.hash ^ self._piece_key, depth, EXACT, value, col)
+        return col, value
+    
+    def new_search(self, board):
+        """
+        Reset the per-move search state before searching a new position.
+        Killer moves are ply-relative so they are cleared; history scores are
+        halved so older results fade out without being forgotten.
+        
+        Args:
+            board (Board): Position about to be searched
+        """
+        self.nodes = 0
+        self.last_depth = 0
+        self.cancelled = False
+        self.stats = SearchStats()
+        self._stats = self.stats if self.collect_stats else None
+        self.killers = [[None, None] for _ in range(board.rows * board.columns + 1)]
+        for table in self.history[1:]:
+            for cell in list(table):
+                table[cell] >>= 1
+                if not table[cell]:
+                    del table[cell]
+    
+    def order_moves(self, board, tt_move, ply, piece):
+        """
+        Order the legal moves so the most promising are searched first: the
+        transposition-table move, then this ply's killer moves, then by history
+        score, with center-first order breaking ties.
+        
+        Args:
+            board (Board): Current game board state
+            tt_move (int): Best move stored in the transposition table, or None
+            ply (int): Distance from the root of the search
+            piece (int): Piece to move
+            
+        Returns:
+            list: Legal columns in search order
+        """
+        heights = board.heights
+        rows = board.rows
+        stride = rows + 1
+        history = self.history[piece]
+        moves = [c for c in center_order(board.columns) if heights[c] < rows]
+        if history:
+            moves.sort(key=lambda c: history.get(c * stride + heights[c], 0), reverse=True)
+        front = [tt_move] if tt_move is not None else []
+        if ply < len(self.killers):
+            front += [k for k in self.killers[ply] if k is not None and k != tt_move]
+        if front:
+            front = [c for c in front if c in moves]
+            moves = front + [c for c in moves if c not in front]
+        return moves
+    
+    def record_cutoff(self, board, col, depth, ply, piece):
+        """
+        Remember a move that caused a beta cutoff as a killer for its ply and
+        credit it in the history table.
+        
+        Args:
+            board (Board): Board before the move was played
+            col (int): Column that caused the cutoff
+            depth (int): Remaining depth at the cutoff node
+            ply (int): Distance from the root of the search
+            piece (int): Piece that moved
+        """
+        if ply < len(self.killers):
+            killers = self.killers[ply]
+            if killers[0] != col:
+                killers[1] = killers[0]
+                killers[0] = col
+        cell = col * (board.rows + 1) + board.heights[col]
+        history = self.history[piece]
+        history[cell] = history.get(cell, 0) + depth * depth
     
     def minimax_move(self, board, depth=5):
         """
@@ -53,9 +796,12 @@ class AIPlayer:
         col, _ = self.minimax(board, depth, -math.inf, math.inf, True)
         return col
     
-    def minimax(self, board, depth, alpha, beta, maximizing_player):
+    def minimax(self, board, depth, alpha, beta, maximizing_player, ply=0):
         """
         Implement the Minimax algorithm with alpha-beta pruning.
+        Children are searched by playing and undoing moves on the given board,
+        which is left unchanged on return. Results are cached in the
+        transposition table keyed by the board's Zobrist hash and the side to move.
         
         Args:
             board (Board): Current game board state
@@ -63,60 +809,138 @@ class AIPlayer:
             alpha (float): Alpha value for pruning
             beta (float): Beta value for pruning
             maximizing_player (bool): True if maximizing player's turn
+            ply (int): Distance from the root, used for killer moves
             
         Returns:
             tuple: (column index, score) for the best move
         """
-        valid_locations = board.get_valid_locations()
+        self.nodes += 1
+        if not self.nodes & DEADLINE_CHECK_INTERVAL and self._should_stop():
+            raise SearchTimeout()
+        stats = self._stats
+        if stats is not None and ply > stats.max_ply:
+            stats.max_ply = ply
+        
         is_terminal = board.is_terminal_node()
         
         if depth == 0 or is_terminal:
             if is_terminal:
-                if board.winning_move(2):  # AI wins
-                    return (None, 1000000)
-                elif board.winning_move(1):  # Player wins
-                    return (None, -1000000)
+                if board.winning_move(self.piece):  # AI wins
+                    return (None, WIN_SCORE)
+                elif board.winning_move(self.opp_piece):  # Opponent wins
+                    return (None, -WIN_SCORE)
                 else:  # Draw
                     return (None, 0)
             else:  # Depth is zero
-                return (None, board.score_position(2))
+                if stats is not None:
+                    stats.leaf_evals += 1
+                return (None, board.score_position(self.piece))
         
-        if maximizing_player:
-            value = -math.inf
-            column = random.choice(valid_locations) if valid_locations else 0
-            
-            for col in valid_locations:
-                row = board.get_next_open_row(col)
-                temp_board = board.copy()
-                temp_board.drop_piece(row, col, 2)
-                new_score = self.minimax(temp_board, depth-1, alpha, beta, False)[1]
-                
-                if new_score > value:
-                    value = new_score
-                    column = col
-                
-                alpha = max(alpha, value)
+        key = board.hash ^ self._piece_key
+        if not maximizing_player:
+            key ^= MINIMIZER_KEY
+        alpha_orig, beta_orig = alpha, beta
+        tt_move = None
+        entry = self.tt.probe(key)
+        if entry is not None:
+            _, entry_depth, bound, entry_value, tt_move = entry
+            # A root cutoff would skip collecting the tied moves
+            if entry_depth >= depth and not (ply == 0 and self.random_ties):
+                if bound == EXACT:
+                    return tt_move, entry_value
+                elif bound == LOWER_BOUND:
+                    alpha = max(alpha, entry_value)
+                else:
+                    beta = min(beta, entry_value)
                 if alpha >= beta:
-                    break
-            
-            return column, value
+                    return tt_move, entry_value
+        
+        piece = self.piece if maximizing_player else self.opp_piece
+        value = -math.inf if maximizing_player else math.inf
+        best_cols = []  # All columns sharing the best score
+        # Searching just below alpha gives a move that ties the best its exact score
+        tie_margin = 1 if ply == 0 and self.random_ties else 0
         
-        else:  # Minimizing player
-            value = math.inf
-            column = random.choice(valid_locations) if valid_locations else 0
+        for i, col in enumerate(self.order_moves(board, tt_move, ply, piece)):
+            board.play(col, piece)
+            try:
+                new_score = self.minimax(board, depth-1, alpha - tie_margin, beta, not maximizing_player, ply+1)[1]
+            finally:
+                board.undo()
             
-            for col in valid_locations:
-                row = board.get_next_open_row(col)
-                temp_board = board.copy()
-                temp_board.drop_piece(row, col, 1)
-                new_score = self.minimax(temp_board, depth-1, alpha, beta, True)[1]
-                
-                if new_score < value:
-                    value = new_score
-                    column = col
-                
+            if new_score == value:
+                best_cols.append(col)
+            elif (new_score > value) == maximizing_player:
+                value = new_score
+                best_cols = [col]
+            
+            if maximizing_player:
+                alpha = max(alpha, value)
+            else:
                 beta = min(beta, value)
-                if alpha >= beta:
-                    break
+            if alpha >= beta:
+                if stats is not None:
+                    stats.cutoffs += 1
+                    if i == 0:
+                        stats.first_move_cutoffs += 1
+                    by_ply = stats.cutoffs_by_ply
+                    while len(by_ply) <= ply:
+                        by_ply.append(0)
+                    by_ply[ply] += 1
+                self.record_cutoff(board, col, depth, ply, piece)
+                break
+        
+        column = self.select_move(best_cols) if ply == 0 else best_cols[0]
+        if value <= alpha_orig:
+            bound = UPPER_BOUND
+        elif value >= beta_orig:
+            bound = LOWER_BOUND
+        else:
+            bound = EXACT
+        self.tt.store(key, depth, bound, value, column)
+        return column, value
+    
+    def _should_stop(self):
+        """
+        Check the limits of the running search.
+        
+        Returns:
+            bool: True if the search is cancelled or past its deadline
+        """
+        if self._cancel is not None and self._cancel.cancelled:
+            return True
+        return self._deadline is not None and time.perf_counter() > self._deadline
+    
+    def select_move(self, best_cols):
+        """
+        Choose among the root columns that share the best score.
+        
+        Args:
+            best_cols (list): Equally scored columns in search order; the
+                scores are exact only for players with random_ties set
+            
+        Returns:
+            int: Selected column index
+        """
+        return best_cols[0]
+
+class RandomizedAIPlayer(AIPlayer):
+    """
+    Extended AI player class that adds randomization to move selection.
+    This makes AI vs AI matches more interesting by introducing variety in moves.
+    """
+    
+    random_ties = True
+    
+    def select_move(self, best_cols):
+        """
+        Override of the move selection to include randomization.
+        When multiple moves have the same exact score, randomly selects one of them.
+        
+        Args:
+            best_cols (list): Equally scored columns in search order
             
-            return column, value
\ No newline at end of file
+        Returns:
+            int: Randomly selected column among the best moves
+        """
+        return random.choice(best_cols)
@@ -5,80 +5,93 @@ This module handles the game logic and UI for AI vs AI matches, including leader
 
 import pygame
 import sys
-import random
 from board import Board
-from ui import GameUI, Button, GameMenu, BOXING_FONT_PATH
+from ui import GameUI, Button, GameMenu, BOXING_FONT_PATH, frame_scheduler
 from utils import *
-from ai import AIPlayer
+from ai import CancellationToken, RandomizedAIPlayer
 import datetime
 
-class RandomizedAIPlayer(AIPlayer):
+def cancel_pending_move(game):
     """
-    Extended AI player class that adds randomization to move selection.
-    This makes AI vs AI matches more interesting by introducing variety in moves.
+    Stop a game's pending background search, if any, and drop its result.
+
+    Args:
+        game: Game whose pending_move and search_cancel hold the search
     """
-    
-    def minimax(self, board, depth, alpha, beta, maximizing_player):
-        """
-        Override of the minimax algorithm to include randomization in move selection.
-        When multiple moves have the same score, randomly selects one of them.
-        
-        Args:
-            board (Board): Current game board state
-            depth (int): Maximum depth for minimax search
-            alpha (float): Alpha value for pruning
-            beta (float): Beta value for pruning
-            maximizing_player (bool): True if maximizing player's turn
-            
-        Returns:
-            tuple: (selected column, score)
-        """
-        valid_locations = board.get_valid_locations()
-        is_terminal = board.is_terminal_node()
-        if depth == 0 or is_terminal:
-            if is_terminal:
-                if board.winning_move(2):
-                    return (None, 1000000)
-                elif board.winning_move(1):
-                    return (None, -1000000)
-                else:
-                    return (None, 0)
+    if game.pending_move is not None:
+        game.search_cancel.cancel()
+        game.pending_move.cancel()
+        game.pending_move = None
+        game.ui.thinking = None
+
+def idle_frame_timeout(game):
+    """
+    How long an AI vs AI game loop can sleep before its next frame. During the
+    pause after a move, nothing changes on screen but the thinking label.
+
+    Args:
+        game: Game whose next_move_time and game_over are used
+
+    Returns:
+        int: Milliseconds until the pause ends or the thinking label next
+            changes, or None if the loop should keep running at the frame rate
+    """
+    now = pygame.time.get_ticks()
+    if game.game_over or now >= game.next_move_time:
+        return None
+    return min(game.next_move_time - now, THINKING_DOT_INTERVAL - now % THINKING_DOT_INTERVAL)
+
+def step_ai_turn(game, ai1, ai2):
+    """
+    Advance the current AI's turn of an AI vs AI game without blocking the game loop.
+    The search starts right away; its move is applied once it has arrived
+    and the pause after the previous move has passed. Shared by AIVsAIGame
+    and the AI vs AI mode of Game.
+
+    Args:
+        game: Game to advance; its board, ui, ai_turn, pending_move, search_cancel,
+            next_move_time, player_moves, ai1_score, ai2_score and game_over are used
+        ai1 (AIPlayer): AI moving with PLAYER_PIECE
+        ai2 (AIPlayer): AI moving with AI_PIECE
+
+    Returns:
+        bool: True if this step ended the game
+    """
+    if game.ai_turn == PLAYER:
+        ai, piece, name = ai1, PLAYER_PIECE, "AI 1"
+    else:
+        ai, piece, name = ai2, AI_PIECE, "AI 2"
+    if game.pending_move is None:
+        game.search_cancel = CancellationToken()
+        game.pending_move = ai.get_move_async(game.board, game.search_cancel)
+        game.ui.thinking = name
+    if not game.pending_move.done() or pygame.time.get_ticks() < game.next_move_time:
+        return False
+    col = game.pending_move.result()
+    game.pending_move = None
+    game.ui.thinking = None
+    if col is not None and game.board.is_valid_location(col):
+        game.board.drop_piece(game.board.get_next_open_row(col), col, piece)
+        if piece == PLAYER_PIECE:
+            game.player_moves += 1
+
+        # Check for win or draw
+        if game.board.winning_move(piece):
+            win_score = max(1000 - 20 * game.player_moves, 100)
+            if piece == PLAYER_PIECE:
+                game.ai1_score, game.ai2_score = win_score, 0
             else:
-                return (None, board.score_position(2))
-        if maximizing_player:
-            value = -float('inf')
-            best_cols = []  # Store all columns with the best score
-            for col in valid_locations:
-                row = board.get_next_open_row(col)
-                temp_board = board.copy()
-                temp_board.drop_piece(row, col, 2)
-                new_score = self.minimax(temp_board, depth-1, alpha, beta, False)[1]
-                if new_score > value:
-                    value = new_score
-                    best_cols = [col]
-                elif new_score == value:
-                    best_cols.append(col)
-                alpha = max(alpha, value)
-                if alpha >= beta:
-                    break
-            return (random.choice(best_cols), value)  # Randomly select from best moves
-        else:
-            value = float('inf')
-            best_cols = []  # Store all columns with the best score
-            for col in valid_locations:
-                row = board.get_next_open_row(col)
-                temp_board = board.copy()
-                temp_board.drop_piece(row, col, 1)
-                new_score = self.minimax(temp_board, depth-1, alpha, beta, True)[1]
-                if new_score < value:
-                    value = new_score
-                    best_cols = [col]
-                elif new_score == value:
-                    best_cols.append(col)
-                beta = min(beta, value)
-                if alpha >= beta:
-                    break
-            return (random.choice(best_cols), value)  # Randomly select from best moves
+                game.ai1_score, game.ai2_score = 0, win_score
+            game.ui.show_winner(name)
+            game.game_over = True
+        elif game.board.is_full():
+            game.ai1_score = 50
+            game.ai2_score = 50
+            game.ui.show_winner("Draw")
+            game.game_over = True
+    game.ai_turn = AI if game.ai_turn == PLAYER else PLAYER
+    game.next_move_time = pygame.time.get_ticks() + AI_MOVE_DELAY
+    return game.game_over
 
 class AIVsAIGame:
     """
@@ -100,12 +113,17 @@ class AIVsAIGame:
         self.screen_height = screen_height
         self.board = Board()
         self.ui = GameUI(screen, "AI 1", "Red", screen_width, screen_height, ai_vs_ai=True)
-        self.ai1 = RandomizedAIPlayer("hard")
-        self.ai2 = RandomizedAIPlayer("hard")
+        self.ai1 = RandomizedAIPlayer("hard", piece=PLAYER_PIECE)
+        self.ai2 = RandomizedAIPlayer("hard", piece=AI_PIECE)
         self.ai1_score = 0
         self.ai2_score = 0
         self.game_over = False
         self.player_moves = 0
+        # AI moves are computed in the background; the loop polls the pending result
+        self.pending_move = None
+        self.search_cancel = None  # Cancellation token of the pending search
+        self.ai_turn = PLAYER  # PLAYER while AI 1 is to move, AI for AI 2
+        self.next_move_time = 0  # Earliest tick at which the next move is shown
 
     def load_leaderboard(self):
         """
@@ -231,6 +249,19 @@ class AIVsAIGame:
             self.screen.blit(back_text, (center_x - back_text.get_width() / 2, self.screen_height - 40 * scale_factor))
             
             pygame.display.update()
+            frame_scheduler.tick(animating=False)
+
+    def cancel_ai_move(self):
+        """
+        Stop the pending AI search, if any, and drop its result.
+        """
+        cancel_pending_move(self)
+
+    def ai_turn_step(self):
+        """
+        Advance the current AI's turn without blocking the game loop.
+        """
+        step_ai_turn(self, self.ai1, self.ai2)
 
     def run(self):
         """
@@ -244,6 +275,7 @@ class AIVsAIGame:
         while True:
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
+                    self.cancel_ai_move()
                     pygame.quit()
                     sys.exit()
                 if event.type == pygame.VIDEORESIZE:
@@ -254,6 +286,10 @@ class AIVsAIGame:
                     self.ui.screen_width = event.w
                     self.ui.screen_height = event.h
                     self.ui.update_layout()
+                    self.ui.invalidate()
+                if event.type == pygame.WINDOWEXPOSED:
+                    # Part of the window was uncovered; redraw all of it on the next render
+                    self.ui.invalidate()
             
             # Show start screen if game hasn't started
             if not started:
@@ -295,67 +331,23 @@ class AIVsAIGame:
                     self.ui.draw_score((self.ai1_score, self.ai2_score))
                     start_button.draw()
                     pygame.display.update()
+                    frame_scheduler.tick(animating=False)
+                # The start screen drew over the game; the first render redraws everything
+                self.ui.invalidate()
                 continue
             
             # Main game loop
             if not self.game_over:
-                # AI 1's turn
-                col1 = self.ai1.get_move(self.board)
-                if col1 is not None and self.board.is_valid_location(col1):
-                    row1 = self.board.get_next_open_row(col1)
-                    self.board.drop_piece(row1, col1, PLAYER_PIECE)
-                    self.player_moves += 1
-                    
-                    # Check for win or draw
-                    if self.board.winning_move(PLAYER_PIECE):
-                        self.ai1_score = max(1000 - 20 * self.player_moves, 100)
-                        self.ai2_score = 0
-                        self.ui.show_winner("AI 1")
-                        self.game_over = True
-                        continue
-                    elif len(self.board.get_valid_locations()) == 0:
-                        self.ai1_score = 50
-                        self.ai2_score = 50
-                        self.ui.show_winner("Draw")
-                        self.game_over = True
-                        continue
-                
-                pygame.display.update()
-                pygame.time.wait(1200)  # Wait between moves
-                
-                # AI 2's turn
-                if not self.game_over:
-                    col2 = self.ai2.get_move(self.board)
-                    if col2 is not None and self.board.is_valid_location(col2):
-                        row2 = self.board.get_next_open_row(col2)
-                        self.board.drop_piece(row2, col2, AI_PIECE)
-                        
-                        # Check for win or draw
-                        if self.board.winning_move(AI_PIECE):
-                            self.ai1_score = 0
-                            self.ai2_score = max(1000 - 20 * self.player_moves, 100)
-                            self.ui.show_winner("AI 2")
-                            self.game_over = True
-                            continue
-                        elif len(self.board.get_valid_locations()) == 0:
-                            self.ai1_score = 50
-                            self.ai2_score = 50
-                            self.ui.show_winner("Draw")
-                            self.game_over = True
-                            continue
-                    
-                    pygame.display.update()
-                    pygame.time.wait(1200)  # Wait between moves
+                self.ai_turn_step()
             
-            # Update display
-            self.ui.draw_board(self.board.board)
-            self.ui.draw_score((self.ai1_score, self.ai2_score))
+            # Update display, sending only what changed since the last frame
+            self.ui.render(self.board.board, (self.ai1_score, self.ai2_score))
             
             # Handle game over state
             if self.game_over:
                 # Log game result
                 now = datetime.datetime.now().strftime('%Y-%m-%d %H:%M')
-                total_moves = sum(1 for row in self.board.board.flatten() if row != 0)
+                total_moves = self.board.move_count
                 
                 if self.board.winning_move(PLAYER_PIECE):
                     winner = "AI 1"
@@ -446,6 +438,7 @@ class AIVsAIGame:
                     leaderboard_button.draw()
                     menu_button.draw()
                     pygame.display.update()
+                    frame_scheduler.tick(animating=False)
                 
                 # Return to menu
                 current_w, current_h = self.screen.get_size()
@@ -453,4 +446,6 @@ class AIVsAIGame:
                 player_name, difficulty, sprite = menu.show()
                 return (player_name, difficulty, sprite)
             
-            pygame.display.update() 
\ No newline at end of file
+            # Idle through the pause after a move; full speed while waiting for a search
+            timeout = idle_frame_timeout(self)
+            frame_scheduler.tick(timeout is None and not self.game_over, timeout)
\ No newline at end of file
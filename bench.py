@@ -0,0 +1,158 @@
+"""
+Benchmark command for the Connect Four AI.
+Searches a fixed, versioned suite of positions to fixed depths with a fresh
+single-process player for each, and reports the total node count together
+with the time taken and the search speed.
+
+The total node count is a signature of the engine's behavior: it only
+changes when the search, move ordering or evaluation changes, never with the
+machine or its load. A change meant to be a pure speed-up must leave it
+unchanged. Bump BENCH_VERSION whenever the suite itself changes.
+
+Example:
+    python bench.py --repeat 5
+"""
+
+import argparse
+import json
+import math
+import os
+import platform
+import statistics
+import sys
+import time
+from ai import AIPlayer
+from solver import board_from_moves
+
+# Version of the position suite; signatures are only comparable within a version
+BENCH_VERSION = 1
+
+# (1-based column digits played from the empty board, search depth)
+BENCH_POSITIONS = [
+    ("", 9),
+    ("4", 9),
+    ("44", 8),
+    ("3455", 9),
+    ("4453", 9),
+    ("444343", 9),
+    ("12344321", 9),
+    ("5624727721", 9),
+    ("57546325521176", 10),
+    ("15417512665155", 10),
+    ("44741244532746", 10),
+    ("246117513515211552", 11),
+    ("237255753625777722", 11),
+    ("1713466116636564374731", 14),
+]
+
+def bench_position(moves, depth):
+    """
+    Search one suite position with a fresh player, so no state carries over
+    from earlier positions.
+
+    Args:
+        moves (str): 1-based column digits played from the empty board
+        depth (int): Search depth
+
+    Returns:
+        tuple: (best column, nodes searched, seconds taken)
+    """
+    board, piece = board_from_moves(moves)
+    player = AIPlayer("hard", piece=piece, book_path=None, workers=1)
+    start = time.perf_counter()
+    col = player.iterative_deepening(board, depth, math.inf)
+    return col, player.nodes, time.perf_counter() - start
+
+def run_bench(repeat=1, positions=None):
+    """
+    Search every suite position, repeat times over.
+
+    Args:
+        repeat (int): Number of runs over the suite
+        positions (list): (moves, depth) pairs (default: BENCH_POSITIONS)
+
+    Returns:
+        dict: Suite version, total nodes, per-run total times and per-position results
+
+    Raises:
+        RuntimeError: If a position's node count differs between runs
+    """
+    positions = BENCH_POSITIONS if positions is None else positions
+    results = [{"moves": moves, "depth": depth, "move": None, "nodes": None, "times": []}
+               for moves, depth in positions]
+    totals = []
+    for _ in range(repeat):
+        total = 0.0
+        for result in results:
+            col, nodes, elapsed = bench_position(result["moves"], result["depth"])
+            if result["nodes"] is not None and (col, nodes) != (result["move"], result["nodes"]):
+                raise RuntimeError(f"Search of '{result['moves']}' is not deterministic: "
+                                   f"{nodes} nodes, previously {result['nodes']}")
+            result["move"], result["nodes"] = col, nodes
+            result["times"].append(elapsed)
+            total += elapsed
+        totals.append(total)
+    return {
+        "version": BENCH_VERSION,
+        "nodes": sum(result["nodes"] for result in results),
+        "times": totals,
+        "positions": results,
+    }
+
+def summarize(bench):
+    """
+    Reduce a bench run to the figures worth comparing.
+
+    Args:
+        bench (dict): Result of run_bench
+
+    Returns:
+        dict: Signature, median and minimum total time, nodes per second at
+            both, per-position figures and a description of the machine
+    """
+    median = statistics.median(bench["times"])
+    best = min(bench["times"])
+    return {
+        "version": bench["version"],
+        "nodes": bench["nodes"],
+        "repeat": len(bench["times"]),
+        "time_median": median,
+        "time_min": best,
+        "nps_median": bench["nodes"] / median if median > 0 else 0.0,
+        "nps_max": bench["nodes"] / best if best > 0 else 0.0,
+        "positions": [{"moves": result["moves"], "depth": result["depth"], "move": result["move"],
+                       "nodes": result["nodes"], "time_median": statistics.median(result["times"]),
+                       "time_min": min(result["times"])}
+                      for result in bench["positions"]],
+        "machine": {"python": platform.python_version(), "implementation": platform.python_implementation(),
+                    "platform": platform.platform(), "cpus": os.cpu_count()},
+    }
+
+def main():
+    """
+    Command line entry point: run the suite and print the signature and timings.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark the Connect Four AI on a fixed position suite.")
+    parser.add_argument("--repeat", type=int, default=1, help="runs over the suite (default: 1)")
+    parser.add_argument("--json", action="store_true", help="print the results as JSON")
+    args = parser.parse_args()
+
+    summary = summarize(run_bench(max(1, args.repeat)))
+    if args.json:
+        json.dump(summary, sys.stdout, indent=2)
+        print()
+        return
+
+    print(f"{'Position':<24} {'Depth':>5} {'Move':>4} {'Nodes':>10} {'Median ms':>10} {'Min ms':>10}")
+    for position in summary["positions"]:
+        move = position["move"] + 1 if position["move"] is not None else "-"
+        print(f"{position['moves'] or '(empty)':<24} {position['depth']:>5} {move:>4} {position['nodes']:>10} "
+              f"{position['time_median'] * 1000:>10.1f} {position['time_min'] * 1000:>10.1f}")
+    print()
+    print(f"Bench v{summary['version']}, {summary['repeat']} run(s)")
+    print(f"Nodes searched  : {summary['nodes']}")
+    print(f"Total time      : {summary['time_median']:.3f} s median, {summary['time_min']:.3f} s min")
+    print(f"Nodes/second    : {summary['nps_median']:.0f} median, {summary['nps_max']:.0f} best")
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,85 @@
 """
 Board management module for the Connect Four game.
 Handles the game board state, piece placement, and win condition checking.
+
+The board is stored as a pair of bitboards (one integer mask per piece) plus a
+per-column height list. Each column uses ``rows + 1`` bits: the extra sentinel
+bit on top of every column keeps shifted masks from wrapping between columns.
+The heuristic score and win flags are updated incrementally on every move.
 """
 
+from functools import lru_cache
+import random
 import numpy as np
 
+
+@lru_cache(maxsize=None)
+def _geometry(rows, columns):
+    """
+    Precompute the window tables that depend only on the board dimensions.
+    
+    Args:
+        rows (int): Number of rows in the board
+        columns (int): Number of columns in the board
+    
+    Returns:
+        tuple: (window masks, window cell index array of shape (n, 4),
+            windows containing each cell, center column mask) for the given geometry
+    """
+    height = rows + 1
+    
+    def index(r, c):
+        return c * height + r
+    
+    windows = []
+    # Horizontal, vertical, positive diagonal and negative diagonal windows
+    for r in range(rows):
+        for c in range(columns - 3):
+            windows.append([index(r, c + i) for i in range(4)])
+    for c in range(columns):
+        for r in range(rows - 3):
+            windows.append([index(r + i, c) for i in range(4)])
+    for r in range(rows - 3):
+        for c in range(columns - 3):
+            windows.append([index(r + i, c + i) for i in range(4)])
+    for r in range(rows - 3):
+        for c in range(columns - 3):
+            windows.append([index(r + 3 - i, c + i) for i in range(4)])
+    
+    window_masks = tuple(sum(1 << i for i in cells) for cells in windows)
+    window_cells = np.array(windows, dtype=np.intp)
+    # Windows each cell belongs to, indexed like the bitboards
+    cell_windows = tuple(tuple(w for w, cells in enumerate(windows) if i in cells)
+                         for i in range(columns * height))
+    center_mask = sum(1 << index(r, columns // 2) for r in range(rows))
+    return window_masks, window_cells, cell_windows, center_mask
+
+
+@lru_cache(maxsize=None)
+def _zobrist_keys(rows, columns):
+    """
+    Generate the Zobrist keys for every (piece, cell) pair of a geometry.
+    A fixed seed keeps hashes identical across runs and processes.
+    
+    Args:
+        rows (int): Number of rows in the board
+        columns (int): Number of columns in the board
+    
+    Returns:
+        tuple: keys[piece][bit index] as 64-bit integers (keys[0] is unused)
+    """
+    rng = random.Random(0xC4)
+    size = columns * (rows + 1)
+    return ((0,) * size,
+            tuple(rng.getrandbits(64) for _ in range(size)),
+            tuple(rng.getrandbits(64) for _ in range(size)))
+
+
 class Board:
     """
     Represents the game board and manages all board-related operations.
-    Uses a numpy array to store the board state and provides methods for game logic.
+    Uses two bitboards and a column height list to store the board state and
+    provides methods for game logic.
     """
     
     def __init__(self, rows=6, columns=7):
@@ -21,18 +92,149 @@ class Board:
         """
         self.rows = rows
         self.columns = columns
-        self.board = np.zeros((rows, columns))
+        self.masks = [0, 0, 0]  # Indexed by piece; index 0 is unused
+        self.heights = [0] * columns
+        # Columns that still have space, updated only when a column fills or empties
+        self.open_columns = tuple(range(columns))
+        self.move_count = 0
+        self.hash = 0  # Zobrist hash, updated incrementally on every drop
+        self.history = []  # Stack of (column, piece, piece had already won) for undo
+        # Win flags per piece; a new line of four can only pass through the last move
+        self.wins = [False, False, False]
+        self._terminal = False
+        # Running evaluation: summed cell codes per window and score per piece
+        self._windows = _geometry(rows, columns)
+        self.window_codes = [0] * len(self._windows[0])
+        self.scores = [0, 0, 0]
+        self._zobrist = _zobrist_keys(rows, columns)
+        self._grid = None
+    
+    @property
+    def board(self):
+        """
+        2D view of the board for rendering and debugging.
+        Row 0 is the bottom row; cells hold 0 (empty), 1 or 2.
+        
+        Returns:
+            numpy.ndarray: Array of shape (rows, columns)
+        """
+        if self._grid is None:
+            grid = np.zeros((self.rows, self.columns))
+            height = self.rows + 1
+            for piece in (1, 2):
+                mask = self.masks[piece]
+                for c in range(self.columns):
+                    for r in range(self.heights[c]):
+                        if mask >> (c * height + r) & 1:
+                            grid[r][c] = piece
+            self._grid = grid
+        return self._grid
     
     def drop_piece(self, row, col, piece):
         """
         Place a game piece at the specified position.
         
         Args:
-            row (int): Row index where the piece should be placed
+            row (int): Row index where the piece should be placed. Pieces always
+                stack on top of the column, so this must be get_next_open_row(col).
             col (int): Column index where the piece should be placed
             piece (int): Piece identifier (1 for player, 2 for AI)
         """
-        self.board[row][col] = piece
+        index = col * (self.rows + 1) + row
+        self.masks[piece] |= 1 << index
+        self.hash ^= self._zobrist[piece][index]
+        self.heights[col] = row + 1
+        if row + 1 == self.rows:
+            self.open_columns = tuple(c for c in self.open_columns if c != col)
+        # Update only the windows through the new piece
+        codes = self.window_codes
+        step = _CELL_CODES[piece]
+        four = 4 * step
+        deltas_1, deltas_2 = _DROP_DELTAS[piece]
+        delta_1 = delta_2 = 0
+        made_four = False
+        for w in self._windows[2][index]:
+            old = codes[w]
+            codes[w] = old + step
+            delta_1 += deltas_1[old]
+            delta_2 += deltas_2[old]
+            if old + step == four:
+                made_four = True
+        if col == self.columns // 2:
+            if piece == 1:
+                delta_1 += 3
+            else:
+                delta_2 += 3
+        self.scores[1] += delta_1
+        self.scores[2] += delta_2
+        self.move_count += 1
+        self.history.append((col, piece, self.wins[piece]))
+        if made_four:
+            self.wins[piece] = True
+        self._terminal = self.wins[1] or self.wins[2] or self.is_full()
+        self._grid = None
+    
+    def play(self, col, piece):
+        """
+        Drop a piece into a column in place, recording it for undo().
+        
+        Args:
+            col (int): Column index to play; must be a valid location
+            piece (int): Piece identifier (1 for player, 2 for AI)
+        
+        Returns:
+            int: Row index the piece landed on
+        """
+        row = self.heights[col]
+        self.drop_piece(row, col, piece)
+        return row
+    
+    def undo(self):
+        """
+        Take back the most recent move.
+        
+        Returns:
+            tuple: (column, piece) of the move that was removed
+        """
+        col, piece, had_won = self.history.pop()
+        row = self.heights[col] - 1
+        index = col * (self.rows + 1) + row
+        self.masks[piece] &= ~(1 << index)
+        self.hash ^= self._zobrist[piece][index]
+        self.heights[col] = row
+        if row + 1 == self.rows:
+            self.open_columns = tuple(sorted(self.open_columns + (col,)))
+        codes = self.window_codes
+        step = _CELL_CODES[piece]
+        deltas_1, deltas_2 = _DROP_DELTAS[piece]
+        delta_1 = delta_2 = 0
+        for w in self._windows[2][index]:
+            old = codes[w] - step
+            codes[w] = old
+            delta_1 += deltas_1[old]
+            delta_2 += deltas_2[old]
+        if col == self.columns // 2:
+            if piece == 1:
+                delta_1 += 3
+            else:
+                delta_2 += 3
+        self.scores[1] -= delta_1
+        self.scores[2] -= delta_2
+        self.move_count -= 1
+        self.wins[piece] = had_won
+        self._terminal = self.wins[1] or self.wins[2]
+        self._grid = None
+        return col, piece
+    
+    @property
+    def last_move(self):
+        """
+        Most recent move on the board.
+        
+        Returns:
+            tuple: (column, piece) of the last move, or None on an empty board
+        """
+        return self.history[-1][:2] if self.history else None
     
     def is_valid_location(self, col):
         """
@@ -44,7 +246,7 @@ class Board:
         Returns:
             bool: True if the column is valid and has space, False otherwise
         """
-        return col >= 0 and col < self.columns and self.board[self.rows-1][col] == 0
+        return 0 <= col < self.columns and self.heights[col] < self.rows
     
     def get_next_open_row(self, col):
         """
@@ -56,14 +258,14 @@ class Board:
         Returns:
             int: Row index of the next open position, or -1 if column is full
         """
-        for r in range(self.rows):
-            if self.board[r][col] == 0:
-                return r
-        return -1
+        height = self.heights[col]
+        return height if height < self.rows else -1
     
     def winning_move(self, piece):
         """
         Check if the specified piece has a winning combination.
+        Wins are detected when the completing piece is dropped, by checking
+        only the lines through that cell, so this is a constant-time lookup.
         
         Args:
             piece (int): Piece identifier to check for winning combinations
@@ -71,34 +273,27 @@ class Board:
         Returns:
             bool: True if a winning combination is found, False otherwise
         """
-        # Check horizontal
-        for c in range(self.columns-3):
-            for r in range(self.rows):
-                if (self.board[r][c] == piece and self.board[r][c+1] == piece and 
-                    self.board[r][c+2] == piece and self.board[r][c+3] == piece):
-                    return True
-        
-        # Check vertical
-        for c in range(self.columns):
-            for r in range(self.rows-3):
-                if (self.board[r][c] == piece and self.board[r+1][c] == piece and 
-                    self.board[r+2][c] == piece and self.board[r+3][c] == piece):
-                    return True
-        
-        # Check positively sloped diagonals
-        for c in range(self.columns-3):
-            for r in range(self.rows-3):
-                if (self.board[r][c] == piece and self.board[r+1][c+1] == piece and 
-                    self.board[r+2][c+2] == piece and self.board[r+3][c+3] == piece):
-                    return True
-        
-        # Check negatively sloped diagonals
-        for c in range(self.columns-3):
-            for r in range(3, self.rows):
-                if (self.board[r][c] == piece and self.board[r-1][c+1] == piece and 
-                    self.board[r-2][c+2] == piece and self.board[r-3][c+3] == piece):
-                    return True
+        return self.wins[piece]
+    
+    def has_four(self, piece):
+        """
+        Recompute from the bitboard whether a piece has four in a row.
+        Always equal to winning_move(); kept as the reference check.
         
+        Args:
+            piece (int): Piece identifier to check for winning combinations
+            
+        Returns:
+            bool: True if a winning combination is found, False otherwise
+        """
+        position = self.masks[piece]
+        height = self.rows + 1
+        # Vertical, horizontal, and the two diagonal directions; the sentinel
+        # bit on top of each column keeps shifted lines from wrapping
+        for shift in (1, height, height - 1, height + 1):
+            pairs = position & (position >> shift)
+            if pairs & (pairs >> (2 * shift)):
+                return True
         return False
     
     def get_valid_locations(self):
@@ -108,11 +303,25 @@ class Board:
         Returns:
             list: List of valid column indices
         """
-        valid_locations = []
-        for col in range(self.columns):
-            if self.is_valid_location(col):
-                valid_locations.append(col)
-        return valid_locations
+        return list(self.open_columns)
+    
+    def iter_valid_locations(self):
+        """
+        Iterate over the valid column indices without building a new list.
+        
+        Returns:
+            iterator: Valid column indices in ascending order
+        """
+        return iter(self.open_columns)
+    
+    def is_full(self):
+        """
+        Check if every column is full.
+        
+        Returns:
+            bool: True if no more pieces can be placed, False otherwise
+        """
+        return self.move_count == self.rows * self.columns
     
     def is_terminal_node(self):
         """
@@ -121,8 +330,7 @@ class Board:
         Returns:
             bool: True if the game is over, False otherwise
         """
-        return (self.winning_move(1) or self.winning_move(2) or 
-                len(self.get_valid_locations()) == 0)
+        return self._terminal
     
     def evaluate_window(self, window, piece):
         """
@@ -150,9 +358,28 @@ class Board:
             
         return score
     
+    def _window_score_table(self, piece):
+        """
+        Build the window score lookup table from evaluate_window.
+        
+        Args:
+            piece (int): Piece identifier to evaluate for
+        
+        Returns:
+            list: table[own][opp] giving the score of a window holding own
+                pieces of the given player and opp pieces of the opponent
+        """
+        opp_piece = 1 if piece == 2 else 2
+        return [[self.evaluate_window([piece] * own + [opp_piece] * opp + [0] * (4 - own - opp), piece)
+                 if own + opp <= 4 else 0
+                 for opp in range(5)]
+                for own in range(5)]
+    
     def score_position(self, piece):
         """
         Evaluate the entire board position for the specified piece.
+        The score is maintained incrementally as pieces are dropped and undone,
+        so this is a constant-time lookup.
         
         Args:
             piece (int): Piece identifier to evaluate for
@@ -160,38 +387,30 @@ class Board:
         Returns:
             int: Overall score for the board position
         """
-        score = 0
+        return self.scores[piece]
+    
+    def evaluate_position(self, piece):
+        """
+        Recompute the position score for the specified piece from scratch.
+        Always equal to score_position(); kept as the reference evaluation.
+        
+        Args:
+            piece (int): Piece identifier to evaluate for
+        
+        Returns:
+            int: Overall score for the board position
+        """
+        _, window_cells, _, center_mask = self._windows
         
         # Score center column
-        center_array = [int(i) for i in list(self.board[:, self.columns//2])]
-        center_count = center_array.count(piece)
-        score += center_count * 3
-        
-        # Score horizontal
-        for r in range(self.rows):
-            row_array = [int(i) for i in list(self.board[r,:])]
-            for c in range(self.columns-3):
-                window = row_array[c:c+4]
-                score += self.evaluate_window(window, piece)
-        
-        # Score vertical
-        for c in range(self.columns):
-            col_array = [int(i) for i in list(self.board[:,c])]
-            for r in range(self.rows-3):
-                window = col_array[r:r+4]
-                score += self.evaluate_window(window, piece)
-        
-        # Score positive diagonal
-        for r in range(self.rows-3):
-            for c in range(self.columns-3):
-                window = [self.board[r+i][c+i] for i in range(4)]
-                score += self.evaluate_window(window, piece)
-        
-        # Score negative diagonal
-        for r in range(self.rows-3):
-            for c in range(self.columns-3):
-                window = [self.board[r+3-i][c+i] for i in range(4)]
-                score += self.evaluate_window(window, piece)
+        score = (self.masks[piece] & center_mask).bit_count() * 3
+        
+        # Score every horizontal, vertical and diagonal window: each window's
+        # summed cell codes identify its piece counts in the lookup table
+        shifts = np.arange(self.columns * (self.rows + 1), dtype=np.int64)
+        cells = ((self.masks[1] >> shifts) & 1) * _CELL_CODES[1] + ((self.masks[2] >> shifts) & 1) * _CELL_CODES[2]
+        codes = cells.take(window_cells) @ _WINDOW_ONES
+        score += int(_WINDOW_TABLES[piece].take(codes).sum())
         
         return score
     
@@ -203,5 +422,58 @@ class Board:
             Board: New Board instance with the same state
         """
         new_board = Board(self.rows, self.columns)
-        new_board.board = self.board.copy()
-        return new_board
\ No newline at end of file
+        new_board.masks = self.masks[:]
+        new_board.heights = self.heights[:]
+        new_board.open_columns = self.open_columns
+        new_board.move_count = self.move_count
+        new_board.hash = self.hash
+        new_board.history = self.history[:]
+        new_board.wins = self.wins[:]
+        new_board._terminal = self._terminal
+        new_board.window_codes = self.window_codes[:]
+        new_board.scores = self.scores[:]
+        return new_board
+
+
+# Cell codes per piece: a window's summed codes equal count(1) + 5 * count(2)
+_CELL_CODES = (0, 1, 5)
+_WINDOW_ONES = np.ones(4, dtype=np.int64)
+
+
+def _window_tables():
+    """
+    Build the per-piece window score tables indexed by summed cell codes.
+    
+    Returns:
+        tuple: tables[piece] as numpy arrays of length 25 (tables[0] is unused)
+    """
+    scores = Board()._window_score_table(2)  # scores[own][opp], same for both pieces
+    tables = [None, np.zeros(25, dtype=np.int64), np.zeros(25, dtype=np.int64)]
+    for ones in range(5):
+        for twos in range(5 - ones):
+            tables[1][ones + 5 * twos] = scores[ones][twos]
+            tables[2][ones + 5 * twos] = scores[twos][ones]
+    return tuple(tables)
+
+
+_WINDOW_TABLES = _window_tables()
+
+
+def _drop_deltas():
+    """
+    Build the score changes caused by adding a piece to a window.
+    
+    Returns:
+        tuple: deltas[piece] = (changes for piece 1, changes for piece 2), each a
+            list indexed by the window's summed cell codes before the drop
+    """
+    deltas = [None]
+    for piece in (1, 2):
+        step = _CELL_CODES[piece]
+        deltas.append(tuple([int(table[code + step] - table[code]) if code + step < 25 else 0
+                             for code in range(25)]
+                            for table in _WINDOW_TABLES[1:]))
+    return tuple(deltas)
+
+
+_DROP_DELTAS = _drop_deltas()
@@ -7,8 +7,9 @@ import pygame
 import sys
 import random
 from board import Board
-from ai import AIPlayer
-from ui import GameUI, Button, GameMenu
+from ai import AIPlayer, CancellationToken
+from ui import GameUI, Button, GameMenu, frame_scheduler
+from ai_vs_ai import cancel_pending_move, idle_frame_timeout, step_ai_turn
 from utils import *
 from utils import TITLE_YELLOW
 
@@ -39,7 +40,8 @@ class Game:
         self.screen_height = WINDOW_HEIGHT
         self.ai_vs_ai = (difficulty == 'ai_vs_ai')
         self.ui = GameUI(screen, player_name, sprite_choice, self.screen_width, self.screen_height, ai_vs_ai=self.ai_vs_ai)
-        self.ai = AIPlayer('hard' if difficulty == 'ai_vs_ai' else difficulty)
+        # In AI vs AI mode the first AI plays the player's pieces
+        self.ai = AIPlayer('hard', piece=PLAYER_PIECE) if self.ai_vs_ai else AIPlayer(difficulty)
         if self.ai_vs_ai:
             self.ai2 = AIPlayer('hard')
             self.ai1_score = 0
@@ -51,6 +53,14 @@ class Game:
         # Track fullscreen state
         self.fullscreen = False
         self.player_moves = 0  # Track player moves for scoring
+        # AI moves are computed in the background; the loop polls the pending result
+        self.pending_move = None
+        self.search_cancel = None  # Cancellation token of the pending search
+        # The AI ponders on the player's time; the token ends the ponder search
+        self.ponder_future = None
+        self.ponder_cancel = None
+        self.ai_turn = PLAYER  # AI vs AI: PLAYER while AI 1 is to move, AI for AI 2
+        self.next_move_time = 0  # AI vs AI: earliest tick at which the next move is shown
 
     def toggle_fullscreen(self):
         """
@@ -131,6 +141,7 @@ class Game:
         if self.ai_vs_ai:
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
+                    self.cancel_ai_move()
                     pygame.quit()
                     sys.exit()
                 if event.type == pygame.VIDEORESIZE:
@@ -141,10 +152,15 @@ class Game:
                     self.ui.screen_width = event.w
                     self.ui.screen_height = event.h
                     self.ui.update_layout()
+                    self.ui.invalidate()
+                if event.type == pygame.WINDOWEXPOSED:
+                    # Part of the window was uncovered; redraw all of it on the next render
+                    self.ui.invalidate()
             return
         else:
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
+                    self.cancel_ai_move()
                     pygame.quit()
                     sys.exit()
                 if event.type == pygame.VIDEORESIZE:
@@ -155,6 +171,10 @@ class Game:
                     self.ui.screen_width = event.w
                     self.ui.screen_height = event.h
                     self.ui.update_layout()
+                    self.ui.invalidate()
+                if event.type == pygame.WINDOWEXPOSED:
+                    # Part of the window was uncovered; redraw all of it on the next render
+                    self.ui.invalidate()
                     continue
                 if self.game_over:
                     continue
@@ -180,7 +200,7 @@ class Game:
                                 self.ui.show_winner(self.player_name)
                                 self.game_over = True
                                 self.update_leaderboard()
-                            elif len(self.board.get_valid_locations()) == 0:
+                            elif self.board.is_full():
                                 self.score = 50  # Draw
                                 self.ui.show_winner("Draw")
                                 self.game_over = True
@@ -190,12 +210,13 @@ class Game:
     def ai_move(self):
         """
         Handle the AI's turn.
-        Determines the AI's move using the AI player's strategy and updates the game state.
+        Starts the AI's search in the background on the first call and applies
+        the move on the first call after it has arrived, so the game loop keeps
+        running while the AI thinks.
         """
         if self.turn == AI and not self.game_over:
             # Check if there are valid moves
-            valid_locations = self.board.get_valid_locations()
-            if not valid_locations:
+            if self.board.is_full():
                 # Board is full, declare a draw
                 self.score = 50  # Draw
                 self.ui.show_winner("Draw")
@@ -203,10 +224,18 @@ class Game:
                 self.update_leaderboard()
                 return
 
-            col = self.ai.get_move(self.board)
+            if self.pending_move is None:
+                self.search_cancel = CancellationToken()
+                self.pending_move = self.ai.get_move_async(self.board, self.search_cancel)
+                self.ui.thinking = "AI"
+            if not self.pending_move.done():
+                return
+            col = self.pending_move.result()
+            self.pending_move = None
+            self.ui.thinking = None
             if col is None or not self.board.is_valid_location(col):
                 # Log error and treat as draw for safety
-                print(f"AI returned invalid move: {col}. Valid locations: {valid_locations}")
+                print(f"AI returned invalid move: {col}. Valid locations: {self.board.get_valid_locations()}")
                 self.score = 50  # Draw
                 self.ui.show_winner("Draw")
                 self.game_over = True
@@ -215,14 +244,14 @@ class Game:
 
             row = self.board.get_next_open_row(col)
             self.board.drop_piece(row, col, AI_PIECE)
-            print(f"AI placed piece in column {col}, row {row}")  # Debug log
+            print(f"AI placed piece in column {col}, row {row}: {self.ai.last_stats.summary()}")  # Debug log
 
             if self.board.winning_move(AI_PIECE):
                 self.score = 0  # Loss
                 self.ui.show_winner("AI")
                 self.game_over = True
                 self.update_leaderboard()
-            elif len(self.board.get_valid_locations()) == 0:
+            elif self.board.is_full():
                 self.score = 50  # Draw
                 self.ui.show_winner("Draw")
                 self.game_over = True
@@ -230,6 +259,36 @@ class Game:
 
             self.turn = PLAYER
 
+    def update_pondering(self):
+        """
+        Keep a ponder search running exactly while the player is to move.
+        It is cancelled as soon as the player has moved, before the AI's own
+        search is requested, so that search can use what pondering found.
+        """
+        pondering = self.turn == PLAYER and not self.game_over and not self.ai_vs_ai
+        if pondering and self.ponder_future is None:
+            self.ponder_cancel = CancellationToken()
+            self.ponder_future = self.ai.ponder_async(self.board, self.ponder_cancel)
+        elif not pondering and self.ponder_future is not None:
+            self.ponder_cancel.cancel()
+            self.ponder_future = None
+
+    def cancel_ai_move(self):
+        """
+        Stop the pending AI search and any ponder search, dropping their results.
+        """
+        if self.ponder_future is not None:
+            self.ponder_cancel.cancel()
+            self.ponder_future = None
+        cancel_pending_move(self)
+
+    def ai_vs_ai_move(self):
+        """
+        Advance the current AI's turn in AI vs AI mode without blocking the game loop.
+        """
+        if step_ai_turn(self, self.ai, self.ai2):
+            self.update_leaderboard()
+
     def run(self):
         """
         Run the main game loop.
@@ -276,62 +335,22 @@ class Game:
                     self.ui.draw_score(self.score)
                     start_button.draw()
                     pygame.display.update()
+                    frame_scheduler.tick(animating=False)
+                # The start screen drew over the game; the first render redraws everything
+                self.ui.invalidate()
                 continue
             if self.ai_vs_ai:
                 if not self.game_over:
-                    # AI 1 (PLAYER_PIECE)
-                    col1 = self.ai.get_move(self.board)
-                    if col1 is not None and self.board.is_valid_location(col1):
-                        row1 = self.board.get_next_open_row(col1)
-                        self.board.drop_piece(row1, col1, PLAYER_PIECE)
-                        self.player_moves += 1
-                        if self.board.winning_move(PLAYER_PIECE):
-                            self.ai1_score = max(1000 - 20 * self.player_moves, 100)
-                            self.ai2_score = 0
-                            self.ui.show_winner("AI 1")
-                            self.game_over = True
-                            self.update_leaderboard()
-                            continue
-                        elif len(self.board.get_valid_locations()) == 0:
-                            self.ai1_score = 50
-                            self.ai2_score = 50
-                            self.ui.show_winner("Draw")
-                            self.game_over = True
-                            self.update_leaderboard()
-                            continue
-                    pygame.display.update()
-                    pygame.time.wait(1200)
-                    # AI 2 (AI_PIECE)
-                    if not self.game_over:
-                        col2 = self.ai2.get_move(self.board)
-                        if col2 is not None and self.board.is_valid_location(col2):
-                            row2 = self.board.get_next_open_row(col2)
-                            self.board.drop_piece(row2, col2, AI_PIECE)
-                            if self.board.winning_move(AI_PIECE):
-                                self.ai1_score = 0
-                                self.ai2_score = max(1000 - 20 * self.player_moves, 100)
-                                self.ui.show_winner("AI 2")
-                                self.game_over = True
-                                self.update_leaderboard()
-                                continue
-                            elif len(self.board.get_valid_locations()) == 0:
-                                self.ai1_score = 50
-                                self.ai2_score = 50
-                                self.ui.show_winner("Draw")
-                                self.game_over = True
-                                self.update_leaderboard()
-                                continue
-                        pygame.display.update()
-                        pygame.time.wait(1200)
+                    self.ai_vs_ai_move()
             else:
+                self.update_pondering()
                 self.ai_move()
 
-            # Draw the game
-            self.ui.draw_board(self.board.board)
+            # Draw the game, sending only what changed since the last frame to the display
             if self.ai_vs_ai:
-                self.ui.draw_score((self.ai1_score, self.ai2_score))
+                self.ui.render(self.board.board, (self.ai1_score, self.ai2_score))
             else:
-                self.ui.draw_score(self.score)
+                self.ui.render(self.board.board, self.score)
 
             if self.game_over:
                 # Wait for 1 second before showing options
@@ -419,9 +438,18 @@ class Game:
                     leaderboard_button.draw()
                     menu_button.draw()
                     pygame.display.update()
+                    frame_scheduler.tick(animating=False)
                 # Return to menu
                 current_w, current_h = self.screen.get_size()
                 menu = GameMenu(self.screen, current_w, current_h)
                 player_name, difficulty, sprite = menu.show()
                 self.__init__(self.screen, player_name, difficulty, sprite)
-            pygame.display.update()
+            # Full speed while the AI is at work; otherwise sleep until the player does something
+            timeout = None
+            if self.ai_vs_ai:
+                # Idle through the pause after a move; full speed while waiting for a search
+                timeout = idle_frame_timeout(self)
+                animating = timeout is None and not self.game_over
+            else:
+                animating = self.pending_move is not None or (self.turn == AI and not self.game_over)
+            frame_scheduler.tick(animating, timeout)
@@ -0,0 +1,287 @@
+"""
+Opening book module for the Connect Four AI.
+Builds a compact, sorted binary file of early positions and their best moves,
+and reads it back through mmap so several processes share one copy in memory.
+
+Positions are keyed from the point of view of the side to move, so the book
+works whichever piece started the game. Mirror images are folded together:
+only the smaller of a position's key and its mirrored key is stored.
+
+No book ships with the game; the hard and perfect levels use one only after
+it has been built. Run as a script to build it next to this module, for example:
+    python opening_book.py --plies 4 --depth 8
+"""
+
+import argparse
+import mmap
+import os
+import struct
+import time
+from concurrent.futures import ProcessPoolExecutor
+from board import Board
+from solver import Solver, SolverTimeout
+
+# Next to this module, so the book is found whatever the working directory
+DEFAULT_BOOK_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "opening_book.bin")
+
+# File layout: header, then entries sorted by key
+BOOK_MAGIC = b"C4BK"
+BOOK_VERSION = 1
+HEADER = struct.Struct("<4sHBBBxI")  # magic, version, rows, columns, max ply, entry count
+ENTRY = struct.Struct("<QBbB")       # key, move, score, flags
+
+# Entry flags
+FLAG_EXACT = 1  # Score is the solver's game-theoretic score; otherwise only the move is known
+
+def position_key(board, piece):
+    """
+    Compute the book key of a position from the side to move's point of view.
+    Each column holds the mover's stones plus a marker bit above the top stone.
+
+    Args:
+        board (Board): Position to key
+        piece (int): Piece of the side to move
+
+    Returns:
+        int: Unique key of the position
+    """
+    stride = board.rows + 1
+    mask = board.masks[1] | board.masks[2]
+    bottom = sum(1 << (c * stride) for c in range(board.columns))
+    return board.masks[piece] + mask + bottom
+
+def mirror_key(key, rows, columns):
+    """
+    Mirror a position key left to right.
+
+    Args:
+        key (int): Position key
+        rows (int): Number of rows in the board
+        columns (int): Number of columns in the board
+
+    Returns:
+        int: Key of the mirrored position
+    """
+    stride = rows + 1
+    column_bits = (1 << stride) - 1
+    mirrored = 0
+    for c in range(columns):
+        mirrored |= ((key >> (c * stride)) & column_bits) << ((columns - 1 - c) * stride)
+    return mirrored
+
+def canonical_key(board, piece):
+    """
+    Compute the key shared by a position and its mirror image.
+
+    Args:
+        board (Board): Position to key
+        piece (int): Piece of the side to move
+
+    Returns:
+        tuple: (canonical key, True if the canonical form is the mirror image)
+    """
+    key = position_key(board, piece)
+    mirrored = mirror_key(key, board.rows, board.columns)
+    return (mirrored, True) if mirrored < key else (key, False)
+
+class OpeningBook:
+    """
+    Read-only opening book backed by a memory-mapped file.
+    Lookups binary-search the sorted entries directly in the mapping.
+    """
+
+    def __init__(self, path=DEFAULT_BOOK_PATH):
+        """
+        Open and map a book file.
+
+        Args:
+            path (str): Path of the book file
+
+        Raises:
+            ValueError: If the file is not a book of a supported version
+        """
+        self.path = path
+        with open(path, "rb") as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.rows, self.columns, self.max_ply, self.count = HEADER.unpack_from(self._map, 0)
+        if magic != BOOK_MAGIC or version != BOOK_VERSION:
+            self._map.close()
+            raise ValueError(f"{path} is not a version {BOOK_VERSION} opening book")
+
+    def close(self):
+        """
+        Release the memory mapping.
+        """
+        self._map.close()
+
+    def _find(self, key):
+        """
+        Binary-search the entries for a key.
+
+        Args:
+            key (int): Canonical position key
+
+        Returns:
+            tuple: (move, score, flags) of the entry, or None if absent
+        """
+        low, high = 0, self.count
+        while low < high:
+            mid = (low + high) // 2
+            entry_key, move, score, flags = ENTRY.unpack_from(self._map, HEADER.size + mid * ENTRY.size)
+            if entry_key < key:
+                low = mid + 1
+            elif entry_key > key:
+                high = mid
+            else:
+                return move, score, flags
+        return None
+
+    def lookup(self, board, piece):
+        """
+        Look up the book move for a position.
+
+        Args:
+            board (Board): Current game board state
+            piece (int): Piece of the side to move
+
+        Returns:
+            tuple: (column, score, exact) or None if the position is not in the book
+        """
+        if (board.rows, board.columns) != (self.rows, self.columns) or board.move_count > self.max_ply:
+            return None
+        key, mirrored = canonical_key(board, piece)
+        found = self._find(key)
+        if found is None:
+            return None
+        move, score, flags = found
+        if mirrored:
+            move = self.columns - 1 - move
+        return move, score, bool(flags & FLAG_EXACT)
+
+_open_books = {}
+
+def load_book(path=DEFAULT_BOOK_PATH):
+    """
+    Open a book once per process and share it between players.
+
+    Args:
+        path (str): Path of the book file
+
+    Returns:
+        OpeningBook: The opened book, or None if the file does not exist or is invalid
+    """
+    if path not in _open_books:
+        try:
+            _open_books[path] = OpeningBook(path)
+        except (OSError, ValueError, struct.error):
+            _open_books[path] = None
+    return _open_books[path]
+
+def enumerate_positions(max_ply, rows=6, columns=7):
+    """
+    Collect every non-terminal position reachable within max_ply moves,
+    one representative per canonical key.
+
+    Args:
+        max_ply (int): Deepest number of moves to include
+        rows (int): Number of rows in the board
+        columns (int): Number of columns in the board
+
+    Returns:
+        list: (canonical key, move string) pairs; move strings use 0-based column digits
+    """
+    positions = {}
+    frontier = [""]
+    for ply in range(max_ply + 1):
+        next_frontier = []
+        for moves in frontier:
+            board = Board(rows, columns)
+            piece = 1
+            for ch in moves:
+                board.play(int(ch), piece)
+                piece = 3 - piece
+            if board.is_terminal_node():
+                continue
+            key, _ = canonical_key(board, piece)
+            if key in positions:
+                continue
+            positions[key] = moves
+            if ply < max_ply:
+                next_frontier.extend(moves + str(c) for c in board.iter_valid_locations())
+        frontier = next_frontier
+    return sorted(positions.items())
+
+def _analyze_position(args):
+    """
+    Compute the book entry for one position (runs in a worker process).
+
+    Args:
+        args (tuple): (canonical key, move string, search depth, solver seconds)
+
+    Returns:
+        tuple: (canonical key, move, score, flags) for the canonical orientation
+    """
+    from ai import AIPlayer
+    key, moves, depth, solve_time = args
+    board = Board()
+    piece = 1
+    for ch in moves:
+        board.play(int(ch), piece)
+        piece = 3 - piece
+    _, mirrored = canonical_key(board, piece)
+    score, flags = 0, 0
+    try:
+        move, score = Solver(board.rows, board.columns).best_move(board, piece, time.perf_counter() + solve_time)
+        flags = FLAG_EXACT
+    except SolverTimeout:
+        move = AIPlayer("hard", piece=piece).iterative_deepening(board, depth, float("inf"))
+    if mirrored:
+        move = board.columns - 1 - move
+    return key, move, score, flags
+
+def build_book(path, max_ply, depth=8, solve_time=1.0, workers=None):
+    """
+    Precompute best moves for all positions up to max_ply and write a book file.
+    Positions the solver cannot finish within solve_time use a fixed-depth
+    heuristic search instead and are stored without an exact score.
+
+    Args:
+        path (str): Output file path
+        max_ply (int): Deepest number of moves to include
+        depth (int): Heuristic search depth for unsolved positions
+        solve_time (float): Seconds the solver may spend per position
+        workers (int): Worker processes (default: one per CPU)
+
+    Returns:
+        int: Number of entries written
+    """
+    board = Board()
+    positions = enumerate_positions(max_ply, board.rows, board.columns)
+    tasks = [(key, moves, depth, solve_time) for key, moves in positions]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        entries = sorted(pool.map(_analyze_position, tasks, chunksize=8))
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as file:
+        file.write(HEADER.pack(BOOK_MAGIC, BOOK_VERSION, board.rows, board.columns, max_ply, len(entries)))
+        for key, move, score, flags in entries:
+            file.write(ENTRY.pack(key, move, score, flags))
+    os.replace(tmp_path, path)
+    return len(entries)
+
+def main():
+    """
+    Command line entry point for building an opening book.
+    """
+    parser = argparse.ArgumentParser(description="Build a Connect Four opening book.")
+    parser.add_argument("--plies", type=int, default=4, help="deepest number of moves to include")
+    parser.add_argument("--depth", type=int, default=8, help="heuristic search depth for unsolved positions")
+    parser.add_argument("--solve-time", type=float, default=1.0, help="solver seconds per position")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes")
+    parser.add_argument("--output", default=DEFAULT_BOOK_PATH, help="output file")
+    args = parser.parse_args()
+    start = time.perf_counter()
+    count = build_book(args.output, args.plies, args.depth, args.solve_time, args.workers)
+    print(f"Wrote {count} positions to {args.output} in {time.perf_counter() - start:.1f}s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,355 @@
+"""
+Parallel search module for the Connect Four AI.
+Splits the root moves of a search across a pool of worker processes, so deep
+searches use every core instead of one.
+
+Each worker process keeps its own AI player and solver between tasks. The
+players of all workers probe and store into one shared-memory transposition
+table, so work done by one worker is reused by the others and by later moves.
+Workers also share the best root score found so far through a shared value
+and use it as their starting alpha bound. The first root move, the previous
+iteration's best, is searched on its own before the others are split, so
+they all start from its score instead of an open window. The table's counters live in each
+worker process, so every task reports what it added and the pool keeps the totals.
+"""
+
+import atexit
+import math
+import multiprocessing
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from board import Board
+from transposition import SharedTranspositionTable
+
+# Pools shared by every player in the process, keyed by (workers, TT size)
+_pools = {}
+
+# Seconds between two cancellation checks while waiting for workers
+CANCEL_POLL_INTERVAL = 0.05
+
+# SharedTranspositionTable counters reported by each search task, in order
+TABLE_COUNTERS = ("hits", "stores", "collisions", "overwrites")
+
+class _SharedCancellation:
+    """
+    Cancellation token of a worker process, set through the pool's shared abort flag.
+    """
+
+    def __init__(self, flag):
+        self._flag = flag
+
+    @property
+    def cancelled(self):
+        return bool(self._flag.value)
+
+# Per-process state of a worker, set up by _init_worker
+_worker_alpha = None
+_worker_cancel = None
+_worker_table = None
+_worker_players = {}
+_worker_searches = {}  # Piece -> id of the move each worker player last searched for
+_worker_solver = None
+
+def _init_worker(alpha, abort, table):
+    """
+    Initialize a worker process with the state shared by the pool.
+
+    Args:
+        alpha (multiprocessing.Value): Best root score found so far in the current search
+        abort (multiprocessing.Value): Set to 1 to cancel the current search
+        table (SharedTranspositionTable): Transposition table shared by all workers
+    """
+    global _worker_alpha, _worker_cancel, _worker_table
+    _worker_alpha = alpha
+    _worker_cancel = _SharedCancellation(abort)
+    _worker_table = table
+
+def _replay(rows, columns, moves):
+    """
+    Rebuild a board from its move history.
+
+    Args:
+        rows (int): Number of rows in the board
+        columns (int): Number of columns in the board
+        moves (list): (column, piece) pairs in the order they were played
+
+    Returns:
+        Board: The rebuilt board
+    """
+    board = Board(rows, columns)
+    for col, piece in moves:
+        board.play(col, piece)
+    return board
+
+def _local_deadline(deadline):
+    """
+    Convert a wall-clock deadline into this process's time.perf_counter() clock.
+
+    Args:
+        deadline (float): time.time() value, or None
+
+    Returns:
+        float: time.perf_counter() value, or None
+    """
+    if deadline is None:
+        return None
+    return time.perf_counter() + (deadline - time.time())
+
+def _search_root_move(rows, columns, moves, piece, col, depth, deadline, search_id, collect_stats):
+    """
+    Search one root move in a worker process.
+    The search window starts just below the shared alpha, so a move that ties
+    the best score so far still gets its exact score and can be compared.
+    Killer moves and history scores are kept across the tasks of one move,
+    as across the iterations of a serial search.
+
+    Args:
+        rows (int): Number of rows in the board
+        columns (int): Number of columns in the board
+        moves (list): (column, piece) history of the root position
+        piece (int): Piece of the searching player, to move at the root
+        col (int): Root move to search
+        depth (int): Search depth counted from the root
+        deadline (float): time.time() value to give up at, or None
+        search_id (int): Id of the move being searched, from RootSearchPool.new_search
+        collect_stats (bool): Also collect the per-node counters of SearchStats
+
+    Returns:
+        tuple: (score, SearchStats of the task, table counter increments in
+            TABLE_COUNTERS order); score is None if the deadline passed or the
+            search was cancelled
+    """
+    from ai import AIPlayer, SearchStats, SearchTimeout
+    player = _worker_players.get(piece)
+    if player is None:
+        player = AIPlayer("hard", tt_size_mb=0, piece=piece, book_path=None, workers=1)
+        player.tt = _worker_table
+        _worker_players[piece] = player
+    board = _replay(rows, columns, moves)
+    if _worker_searches.get(piece) != search_id:
+        player.new_search(board)
+        _worker_searches[piece] = search_id
+    nodes = player.nodes
+    stats = SearchStats()
+    player._stats = stats if collect_stats else None
+    counters = [getattr(_worker_table, name) for name in TABLE_COUNTERS]
+    alpha = _worker_alpha.value - 1
+    board.play(col, piece)
+    player._deadline = _local_deadline(deadline)
+    player._cancel = _worker_cancel
+    try:
+        _, score = player.minimax(board, depth - 1, alpha, math.inf, False, 1)
+    except SearchTimeout:
+        score = None
+    finally:
+        player._deadline = None
+        player._cancel = None
+    counters = tuple(getattr(_worker_table, name) - start for name, start in zip(TABLE_COUNTERS, counters))
+    stats.nodes = player.nodes - nodes
+    stats.tt_hits, stats.tt_stores = counters[0], counters[1]
+    if score is not None and score > alpha:
+        with _worker_alpha.get_lock():
+            if score > _worker_alpha.value:
+                _worker_alpha.value = score
+    return score, stats, counters
+
+def _solve_root_move(rows, columns, moves, piece, col, deadline):
+    """
+    Compute the exact score of one root move in a worker process.
+
+    Args:
+        rows (int): Number of rows in the board
+        columns (int): Number of columns in the board
+        moves (list): (column, piece) history of the root position
+        piece (int): Piece of the side to move
+        col (int): Root move to solve
+        deadline (float): time.time() value to give up at, or None
+
+    Returns:
+        int: Score of the move, or None if the deadline passed or the solve was cancelled
+    """
+    from solver import Solver, SolverTimeout
+    global _worker_solver
+    if _worker_solver is None or (_worker_solver.rows, _worker_solver.columns) != (rows, columns):
+        _worker_solver = Solver(rows, columns)
+    board = _replay(rows, columns, moves)
+    try:
+        return _worker_solver.score_move(board, piece, col, _local_deadline(deadline), _worker_cancel)
+    except SolverTimeout:
+        return None
+
+class RootSearchPool:
+    """
+    Pool of worker processes that search or solve root moves in parallel.
+    Results are returned in the order the moves were given, so the caller's
+    choice never depends on which worker finished first.
+    """
+
+    def __init__(self, workers, tt_size_mb=16):
+        """
+        Start the worker processes.
+
+        Args:
+            workers (int): Number of worker processes
+            tt_size_mb (float): Memory cap of the shared transposition table
+        """
+        # Spawned rather than forked: the parent may be running pygame and other threads
+        context = multiprocessing.get_context("spawn")
+        self.workers = workers
+        self._alpha = context.Value("d", -math.inf)
+        self._abort = context.Value("b", 0)
+        self.table = SharedTranspositionTable(tt_size_mb)
+        self._search_id = 0
+        # Shared table counters summed over every search task of every worker
+        self.tt_hits = 0
+        self.tt_stores = 0
+        self.tt_collisions = 0
+        self.tt_overwrites = 0
+        self._executor = ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                                             initializer=_init_worker,
+                                             initargs=(self._alpha, self._abort, self.table))
+
+    def new_search(self):
+        """
+        Start searching for a new move: the workers reset their killer moves
+        and age their history scores before their next task.
+        """
+        self._search_id += 1
+
+    def search(self, board, piece, columns, depth, deadline=None, cancel=None, collect_stats=False):
+        """
+        Search each root move to a fixed depth.
+        The first move is searched alone to set the shared alpha, then the
+        rest are split across the workers.
+
+        Args:
+            board (Board): Root position
+            piece (int): Piece of the searching player, to move at the root
+            columns (list): Root moves to search
+            depth (int): Search depth counted from the root
+            deadline (float): time.perf_counter() value to give up at, or None
+            cancel (CancellationToken): Token that stops the workers early, or None
+            collect_stats (bool): Also collect the per-node counters of SearchStats
+
+        Returns:
+            tuple: (scores in the order of columns or None if the deadline passed
+                or the search was cancelled, SearchStats summed over every task)
+        """
+        self._alpha.value = -math.inf
+        self._abort.value = 0
+        moves = [(col, p) for col, p, _ in board.history]
+        deadline = self._wall_deadline(deadline)
+        results = []
+        for batch in (columns[:1], columns[1:]):
+            futures = [self._executor.submit(_search_root_move, board.rows, board.columns,
+                                             moves, piece, col, depth, deadline, self._search_id, collect_stats)
+                       for col in batch]
+            results += self._gather(futures, cancel)
+            if results and results[0][0] is None:
+                # Out of time or cancelled before the first move was searched
+                break
+        scores = [score for score, _, _ in results]
+        stats = results[0][1]
+        for _, task_stats, _ in results[1:]:
+            stats.merge(task_stats)
+        for _, _, (hits, stores, collisions, overwrites) in results:
+            self.tt_hits += hits
+            self.tt_stores += stores
+            self.tt_collisions += collisions
+            self.tt_overwrites += overwrites
+        return (None if None in scores else scores), stats
+
+    def solve(self, board, piece, columns, deadline=None, cancel=None):
+        """
+        Compute the exact score of each root move.
+
+        Args:
+            board (Board): Root position
+            piece (int): Piece of the side to move
+            columns (list): Root moves to solve
+            deadline (float): time.perf_counter() value to give up at, or None
+            cancel (CancellationToken): Token that stops the workers early, or None
+
+        Returns:
+            list: Scores in the order of columns, or None if the deadline passed
+                or the solve was cancelled
+        """
+        self._abort.value = 0
+        moves = [(col, p) for col, p, _ in board.history]
+        deadline = self._wall_deadline(deadline)
+        futures = [self._executor.submit(_solve_root_move, board.rows, board.columns,
+                                         moves, piece, col, deadline)
+                   for col in columns]
+        scores = self._gather(futures, cancel)
+        return None if None in scores else scores
+
+    def _gather(self, futures, cancel):
+        """
+        Wait for every task, passing a cancellation on to the workers.
+
+        Args:
+            futures (list): Submitted tasks
+            cancel (CancellationToken): Token to watch while waiting, or None
+
+        Returns:
+            list: Task results in submission order
+        """
+        pending = set(futures)
+        while pending:
+            _, pending = wait(pending, timeout=CANCEL_POLL_INTERVAL if cancel is not None else None,
+                              return_when=FIRST_COMPLETED)
+            if cancel is not None and cancel.cancelled:
+                self._abort.value = 1
+        return [future.result() for future in futures]
+
+    def shutdown(self):
+        """
+        Stop the worker processes and free the shared table.
+        """
+        self._executor.shutdown(cancel_futures=True)
+        self.table.close()
+        self.table.unlink()
+
+    @staticmethod
+    def _wall_deadline(deadline):
+        """
+        Convert a time.perf_counter() deadline to wall-clock time for the workers.
+
+        Args:
+            deadline (float): time.perf_counter() value, or None
+
+        Returns:
+            float: time.time() value, or None
+        """
+        if deadline is None:
+            return None
+        return time.time() + (deadline - time.perf_counter())
+
+def get_pool(workers, tt_size_mb=16):
+    """
+    Get the process pool for a worker count, starting it on first use.
+    Pools live for the rest of the process and are reused across moves and players.
+
+    Args:
+        workers (int): Number of worker processes
+        tt_size_mb (float): Memory cap of the pool's shared transposition table
+
+    Returns:
+        RootSearchPool: The shared pool
+    """
+    key = (workers, tt_size_mb)
+    pool = _pools.get(key)
+    if pool is None:
+        if not _pools:
+            atexit.register(shutdown_pools)
+        pool = RootSearchPool(workers, tt_size_mb)
+        _pools[key] = pool
+    return pool
+
+def shutdown_pools():
+    """
+    Stop every pool started by get_pool.
+    """
+    while _pools:
+        _, pool = _pools.popitem()
+        pool.shutdown()
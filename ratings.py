@@ -0,0 +1,334 @@
+"""
+Ratings module for AI vs AI results.
+Keeps Elo ratings per engine configuration from game results added one at a
+time, with error bars, and runs a sequential probability ratio test (SPRT) to
+decide whether one configuration is stronger than another with as few games
+as possible.
+
+Ratings are fitted with the Bradley-Terry model, which gives the same Elo
+scale as the usual logistic formula, counting a draw as half a win. Results
+are read from the JSON lines written by tournament.py.
+
+Example:
+    python ratings.py results.jsonl --sprt "hard:time_limit=0.2" "hard:time_limit=0.1"
+"""
+
+import argparse
+import json
+import math
+import numpy as np
+
+# Scale between natural-log strengths and Elo points
+ELO_SCALE = 400 / math.log(10)
+
+# Two-sided 95% normal quantile used for error bars
+Z_95 = 1.959964
+
+def expected_score(elo_diff):
+    """
+    Expected score of a player rated elo_diff points above its opponent.
+
+    Args:
+        elo_diff (float): Rating difference in Elo points
+
+    Returns:
+        float: Expected score between 0 and 1
+    """
+    return 1 / (1 + 10 ** (-elo_diff / 400))
+
+def elo_from_score(score):
+    """
+    Rating difference that corresponds to a score rate.
+
+    Args:
+        score (float): Score rate between 0 and 1
+
+    Returns:
+        float: Elo difference (infinite for a score of 0 or 1)
+    """
+    if score <= 0:
+        return -math.inf
+    if score >= 1:
+        return math.inf
+    return -400 * math.log10(1 / score - 1)
+
+class MatchStats:
+    """
+    Win/draw/loss counts of one player against another.
+    """
+
+    def __init__(self, wins=0, draws=0, losses=0):
+        self.wins = wins
+        self.draws = draws
+        self.losses = losses
+
+    @property
+    def games(self):
+        return self.wins + self.draws + self.losses
+
+    @property
+    def score(self):
+        """
+        Score rate, counting a draw as half a win.
+
+        Returns:
+            float: Value between 0 and 1 (0.5 before any game)
+        """
+        return (self.wins + self.draws / 2) / self.games if self.games else 0.5
+
+    def score_variance(self):
+        """
+        Variance of a single game's score around the mean score.
+
+        Returns:
+            float: Per-game variance (0 before any game)
+        """
+        if not self.games:
+            return 0.0
+        s = self.score
+        return (self.wins * (1 - s) ** 2 + self.draws * (0.5 - s) ** 2 + self.losses * s ** 2) / self.games
+
+    def elo(self):
+        """
+        Rating difference with a 95% confidence interval.
+
+        Returns:
+            tuple: (Elo difference, lower bound, upper bound)
+        """
+        s = self.score
+        margin = Z_95 * math.sqrt(self.score_variance() / self.games) if self.games else 0.0
+        return elo_from_score(s), elo_from_score(s - margin), elo_from_score(s + margin)
+
+class SPRT:
+    """
+    Sequential probability ratio test between two Elo hypotheses:
+    H0 says the rating difference is elo0, H1 says it is elo1.
+    Uses the normal approximation of the log-likelihood ratio over the
+    trinomial win/draw/loss distribution (GSPRT).
+    """
+
+    def __init__(self, elo0=0.0, elo1=5.0, alpha=0.05, beta=0.05):
+        """
+        Set up the test.
+
+        Args:
+            elo0 (float): Elo difference under H0
+            elo1 (float): Elo difference under H1 (greater than elo0)
+            alpha (float): Probability of accepting H1 when H0 is true
+            beta (float): Probability of accepting H0 when H1 is true
+        """
+        self.elo0 = elo0
+        self.elo1 = elo1
+        self.alpha = alpha
+        self.beta = beta
+        self.lower = math.log(beta / (1 - alpha))
+        self.upper = math.log((1 - beta) / alpha)
+
+    def llr(self, stats):
+        """
+        Log-likelihood ratio of H1 against H0 for the results so far.
+
+        Args:
+            stats (MatchStats): Results of the tested configuration against the baseline
+
+        Returns:
+            float: Log-likelihood ratio (0 before any game)
+        """
+        if not stats.games:
+            return 0.0
+        variance = stats.score_variance()
+        if not variance:
+            # Every game ended the same way: estimate the spread with one
+            # virtual game of each result so a one-sided match can still stop
+            variance = MatchStats(stats.wins + 1, stats.draws + 1, stats.losses + 1).score_variance()
+        s0 = expected_score(self.elo0)
+        s1 = expected_score(self.elo1)
+        return stats.games * (s1 - s0) * (2 * stats.score - s0 - s1) / (2 * variance)
+
+    def decision(self, stats):
+        """
+        Decide whether the test can stop.
+
+        Args:
+            stats (MatchStats): Results of the tested configuration against the baseline
+
+        Returns:
+            str: "H1" (accept elo1), "H0" (accept elo0) or None to keep playing
+        """
+        llr = self.llr(stats)
+        if llr >= self.upper:
+            return "H1"
+        if llr <= self.lower:
+            return "H0"
+        return None
+
+class RatingTable:
+    """
+    Incrementally updated results table and ratings of engine configurations.
+    """
+
+    def __init__(self, prior_draws=1.0):
+        """
+        Create an empty table.
+
+        Args:
+            prior_draws (float): Virtual draws added to every pairing that has
+                been played, so unbeaten or winless players get finite ratings
+        """
+        self.prior_draws = prior_draws
+        self.players = []
+        self._index = {}
+        self._matches = {}  # (name, opponent) -> MatchStats from name's point of view
+
+    def add_game(self, player, opponent, result):
+        """
+        Add the result of one game.
+
+        Args:
+            player (str): Name of the first player's configuration
+            opponent (str): Name of the opponent's configuration
+            result (str): "win", "draw" or "loss" from the first player's point of view
+        """
+        for name in (player, opponent):
+            if name not in self._index:
+                self._index[name] = len(self.players)
+                self.players.append(name)
+        ours = self._matches.setdefault((player, opponent), MatchStats())
+        theirs = self._matches.setdefault((opponent, player), MatchStats())
+        if result == "win":
+            ours.wins += 1
+            theirs.losses += 1
+        elif result == "draw":
+            ours.draws += 1
+            theirs.draws += 1
+        elif result == "loss":
+            ours.losses += 1
+            theirs.wins += 1
+        else:
+            raise ValueError(f"Unknown result: {result}")
+
+    def add_record(self, record):
+        """
+        Add a game record written by tournament.py.
+
+        Args:
+            record (dict): Record with "player_a", "player_b" and "result"
+        """
+        self.add_game(record["player_a"], record["player_b"], record["result"])
+
+    def match(self, player, opponent):
+        """
+        Results of one player against another.
+
+        Args:
+            player (str): Configuration name
+            opponent (str): Opponent configuration name
+
+        Returns:
+            MatchStats: Counts from player's point of view
+        """
+        return self._matches.get((player, opponent), MatchStats())
+
+    def ratings(self, iterations=1000, tolerance=1e-9):
+        """
+        Fit Bradley-Terry ratings to all results, centered on a mean of 0.
+
+        Args:
+            iterations (int): Maximum number of fitting iterations
+            tolerance (float): Stop once no strength changes by more than this factor
+
+        Returns:
+            list: (name, Elo, 95% error margin, games) tuples, strongest first
+        """
+        n = len(self.players)
+        if not n:
+            return []
+        games = np.zeros((n, n))
+        points = np.zeros((n, n))
+        for (player, opponent), stats in self._matches.items():
+            i, j = self._index[player], self._index[opponent]
+            if stats.games:
+                games[i, j] = stats.games + self.prior_draws
+                points[i, j] = stats.wins + (stats.draws + self.prior_draws) / 2
+        totals = points.sum(axis=1)
+
+        # Minorization-maximization updates of the strengths (Hunter, 2004)
+        strength = np.ones(n)
+        for _ in range(iterations):
+            denominator = (games / (strength[:, None] + strength[None, :])).sum(axis=1)
+            updated = np.where(denominator > 0, totals / np.where(denominator > 0, denominator, 1), strength)
+            updated /= np.exp(np.log(updated).mean())
+            converged = np.all(np.abs(updated / strength - 1) < tolerance)
+            strength = updated
+            if converged:
+                break
+        elo = ELO_SCALE * np.log(strength)
+
+        # Error bars from the inverse Fisher information of the fitted model
+        p = strength[:, None] / (strength[:, None] + strength[None, :])
+        information = games * p * (1 - p) / ELO_SCALE ** 2
+        information = np.diag(information.sum(axis=1)) - information
+        variance = np.diag(np.linalg.pinv(information))
+        margins = Z_95 * np.sqrt(np.maximum(variance, 0))
+
+        played = (games > 0).sum(axis=1)
+        rows = [(name, float(elo[i]), float(margins[i]) if played[i] else math.inf,
+                 sum(self.match(name, other).games for other in self.players))
+                for i, name in enumerate(self.players)]
+        rows.sort(key=lambda row: row[1], reverse=True)
+        return rows
+
+def load_records(path):
+    """
+    Read game records from a JSON lines file.
+
+    Args:
+        path (str): Path of the file
+
+    Yields:
+        dict: One record per non-empty line
+    """
+    with open(path, "r") as file:
+        for line in file:
+            if line.strip():
+                yield json.loads(line)
+
+def main():
+    """
+    Command line entry point: print ratings and an optional SPRT verdict.
+    """
+    parser = argparse.ArgumentParser(description="Rate AI configurations from tournament results.")
+    parser.add_argument("results", nargs="+", help="JSON lines files written by tournament.py --jsonl")
+    parser.add_argument("--sprt", nargs=2, metavar=("TEST", "BASE"),
+                        help="run an SPRT of configuration TEST against BASE")
+    parser.add_argument("--elo0", type=float, default=0.0, help="Elo difference under H0")
+    parser.add_argument("--elo1", type=float, default=5.0, help="Elo difference under H1")
+    parser.add_argument("--alpha", type=float, default=0.05, help="false positive rate")
+    parser.add_argument("--beta", type=float, default=0.05, help="false negative rate")
+    args = parser.parse_args()
+
+    table = RatingTable()
+    for path in args.results:
+        for record in load_records(path):
+            table.add_record(record)
+
+    print(f"{'Configuration':<32} {'Elo':>8} {'+/-':>8} {'Games':>7}")
+    for name, elo, margin, games in table.ratings():
+        print(f"{name:<32} {elo:>8.1f} {margin:>8.1f} {games:>7}")
+
+    if args.sprt:
+        test, base = args.sprt
+        stats = table.match(test, base)
+        sprt = SPRT(args.elo0, args.elo1, args.alpha, args.beta)
+        elo, low, high = stats.elo()
+        print()
+        print(f"{test} vs {base}: +{stats.wins} ={stats.draws} -{stats.losses}, "
+              f"Elo {elo:.1f} [{low:.1f}, {high:.1f}]")
+        decision = sprt.decision(stats)
+        verdict = {"H1": f"accept H1 (Elo >= {args.elo1})",
+                   "H0": f"accept H0 (Elo <= {args.elo0})",
+                   None: "continue playing"}[decision]
+        print(f"SPRT LLR {sprt.llr(stats):.2f} in [{sprt.lower:.2f}, {sprt.upper:.2f}]: {verdict}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,481 @@
+"""
+Exact solver module for the Connect Four game.
+Computes game-theoretic scores with a negamax search using alpha-beta pruning,
+null-window score probing, a transposition table and symmetric pruning.
+
+Positions use the same bitboard layout as Board: a mask of the stones of the
+side to move and a mask of all stones. Scores follow the usual convention:
+positive if the side to move wins (larger means an earlier win), zero for a
+draw and negative if it loses.
+
+Can also be run headlessly for bulk analysis: every line read from standard
+input is a sequence of 1-based column numbers (for example "4453"), and the
+score and best 0-based column of the resulting position are printed. Blank
+lines are skipped.
+"""
+
+import sys
+import time
+from board import Board
+
+# Number of nodes searched between two deadline and cancellation checks (must be 2^n - 1)
+DEADLINE_CHECK_INTERVAL = 1023
+
+# Positions with at most this many stones are checked for left-right symmetry
+SYMMETRY_MAX_MOVES = 12
+
+class SolverTimeout(Exception):
+    """
+    Raised when a solve runs past its deadline or is cancelled.
+    """
+
+def _previous_prime(n):
+    """
+    Find the largest prime not greater than n.
+
+    Args:
+        n (int): Upper bound (at least 2)
+
+    Returns:
+        int: Largest prime <= n
+    """
+    def is_prime(k):
+        if k < 2:
+            return False
+        d = 2
+        while d * d <= k:
+            if k % d == 0:
+                return False
+            d += 1
+        return True
+    while not is_prime(n):
+        n -= 1
+    return n
+
+class Solver:
+    """
+    Perfect-play solver for Connect Four positions.
+    The transposition table is kept between calls, so solving successive
+    positions of the same game reuses earlier work.
+    """
+
+    def __init__(self, rows=6, columns=7, table_bits=20):
+        """
+        Initialize the solver for a board geometry.
+
+        Args:
+            rows (int): Number of rows in the board (default: 6)
+            columns (int): Number of columns in the board (default: 7)
+            table_bits (int): Transposition table size as a power of two
+        """
+        self.rows = rows
+        self.columns = columns
+        self.size = rows * columns
+        stride = rows + 1
+        self._stride = stride
+        # (1, 2, 3) times the horizontal and both diagonal shifts, for winning_cells
+        self._shifts = tuple((s, 2 * s, 3 * s) for s in (stride, stride - 1, stride + 1))
+        self._bottom_masks = [1 << (c * stride) for c in range(columns)]
+        self._top_masks = [1 << (rows - 1 + c * stride) for c in range(columns)]
+        self._column_masks = [((1 << rows) - 1) << (c * stride) for c in range(columns)]
+        self.bottom_mask = sum(self._bottom_masks)
+        self.board_mask = self.bottom_mask * ((1 << rows) - 1)
+        self.min_score = -self.size // 2 + 3
+        self.max_score = (self.size + 1) // 2 - 3
+        self._order = sorted(range(columns), key=lambda c: abs(2 * c - (columns - 1)))
+        # Upper bounds keyed by position; index by key modulo a prime for spread
+        self._table_size = _previous_prime(1 << table_bits)
+        self._keys = [0] * self._table_size
+        self._values = [0] * self._table_size
+        self.nodes = 0
+        self._deadline = None
+        self._cancel = None
+
+    def reset(self):
+        """
+        Clear the transposition table.
+        """
+        self._keys = [0] * self._table_size
+        self._values = [0] * self._table_size
+
+    def position(self, board, piece):
+        """
+        Convert a Board to solver bitboards.
+
+        Args:
+            board (Board): Board to convert
+            piece (int): Piece of the side to move
+
+        Returns:
+            tuple: (stones of the side to move, all stones, number of moves played)
+        """
+        return board.masks[piece], board.masks[1] | board.masks[2], board.move_count
+
+    def winning_cells(self, position, mask):
+        """
+        Find the empty cells that would complete four in a row for a player.
+
+        Args:
+            position (int): Stones of the player
+            mask (int): All stones on the board
+
+        Returns:
+            int: Bitmask of winning cells, playable now or later
+        """
+        # Vertical
+        r = (position << 1) & (position << 2) & (position << 3)
+        # Horizontal and both diagonals, unrolled: this is the solver's hottest function
+        s1, s2, s3 = self._shifts[0]
+        left = position << s1
+        right = position >> s1
+        p = left & (position << s2)
+        r |= p & ((position << s3) | right)
+        p = right & (position >> s2)
+        r |= p & (left | (position >> s3))
+        s1, s2, s3 = self._shifts[1]
+        left = position << s1
+        right = position >> s1
+        p = left & (position << s2)
+        r |= p & ((position << s3) | right)
+        p = right & (position >> s2)
+        r |= p & (left | (position >> s3))
+        s1, s2, s3 = self._shifts[2]
+        left = position << s1
+        right = position >> s1
+        p = left & (position << s2)
+        r |= p & ((position << s3) | right)
+        p = right & (position >> s2)
+        r |= p & (left | (position >> s3))
+        return r & (self.board_mask ^ mask)
+
+    def can_win_next(self, current, mask):
+        """
+        Check if the side to move can win with its next move.
+
+        Args:
+            current (int): Stones of the side to move
+            mask (int): All stones on the board
+
+        Returns:
+            bool: True if an immediate win is available
+        """
+        return bool(self.winning_cells(current, mask) & (mask + self.bottom_mask) & self.board_mask)
+
+    def non_losing_moves(self, current, mask):
+        """
+        Find the moves that do not hand the opponent an immediate win.
+        Assumes the side to move cannot win immediately.
+
+        Args:
+            current (int): Stones of the side to move
+            mask (int): All stones on the board
+
+        Returns:
+            int: Bitmask with the landing cell of each non-losing move
+        """
+        possible = (mask + self.bottom_mask) & self.board_mask
+        opponent_win = self.winning_cells(current ^ mask, mask)
+        forced = possible & opponent_win
+        if forced:
+            if forced & (forced - 1):
+                return 0  # Two threats cannot both be blocked
+            possible = forced
+        # Never play directly below an opponent winning cell
+        return possible & ~(opponent_win >> 1)
+
+    def is_symmetric(self, current, mask):
+        """
+        Check if a position is its own left-right mirror image.
+
+        Args:
+            current (int): Stones of the side to move
+            mask (int): All stones on the board
+
+        Returns:
+            bool: True if the position is symmetric
+        """
+        stride = self._stride
+        columns = self.columns
+        column_bits = (1 << stride) - 1
+        for c in range(columns // 2):
+            m = columns - 1 - c
+            if ((mask >> (c * stride)) ^ (mask >> (m * stride))) & column_bits:
+                return False
+            if ((current >> (c * stride)) ^ (current >> (m * stride))) & column_bits:
+                return False
+        return True
+
+    def negamax(self, current, mask, moves, alpha, beta):
+        """
+        Score a position with alpha-beta pruning, assuming the side to move
+        cannot win immediately.
+
+        Args:
+            current (int): Stones of the side to move
+            mask (int): All stones on the board
+            moves (int): Number of stones on the board
+            alpha (int): Lower bound of the search window
+            beta (int): Upper bound of the search window
+
+        Returns:
+            int: Exact score if inside (alpha, beta), otherwise a bound beyond the window
+        """
+        self.nodes += 1
+        if not self.nodes & DEADLINE_CHECK_INTERVAL and self._should_stop():
+            raise SolverTimeout()
+
+        size = self.size
+        possible = self.non_losing_moves(current, mask)
+        if not possible:
+            return -((size - moves) // 2)
+        if moves >= size - 2:
+            return 0  # Neither side can win with the last two stones
+
+        # The opponent cannot win with its next move, which bounds the score
+        lower = -((size - 2 - moves) // 2)
+        if alpha < lower:
+            alpha = lower
+            if alpha >= beta:
+                return alpha
+
+        upper = (size - 1 - moves) // 2
+        key = current + mask
+        index = key % self._table_size
+        if self._keys[index] == key:
+            upper = self._values[index] + self.min_score - 1
+        if beta > upper:
+            beta = upper
+            if alpha >= beta:
+                return beta
+
+        # Order moves by the number of threats they create, center first on ties
+        columns = self._order
+        if moves <= SYMMETRY_MAX_MOVES and self.is_symmetric(current, mask):
+            columns = [c for c in columns if c <= (self.columns - 1) // 2]
+        candidates = []
+        for c in columns:
+            move = possible & self._column_masks[c]
+            if move:
+                threats = self.winning_cells(current | move, mask).bit_count()
+                candidates.append((threats, move))
+        candidates.sort(key=lambda item: item[0], reverse=True)
+
+        for _, move in candidates:
+            score = -self.negamax(current ^ mask, mask | move, moves + 1, -beta, -alpha)
+            if score >= beta:
+                return score
+            if score > alpha:
+                alpha = score
+
+        self._keys[index] = key
+        self._values[index] = alpha - self.min_score + 1
+        return alpha
+
+    def _should_stop(self):
+        """
+        Check whether the running solve is cancelled or past its deadline.
+
+        Returns:
+            bool: True if the solve should stop
+        """
+        if self._cancel is not None and self._cancel.cancelled:
+            return True
+        return self._deadline is not None and time.perf_counter() > self._deadline
+
+    def solve_position(self, current, mask, moves):
+        """
+        Compute the exact score of a position by narrowing the score range
+        with null-window searches.
+
+        Args:
+            current (int): Stones of the side to move
+            mask (int): All stones on the board
+            moves (int): Number of stones on the board
+
+        Returns:
+            int: Exact score of the position
+        """
+        if self.can_win_next(current, mask):
+            return (self.size + 1 - moves) // 2
+        low = -((self.size - moves) // 2)
+        high = (self.size + 1 - moves) // 2
+        while low < high:
+            med = low + (high - low) // 2
+            # Probe closer to zero first; those windows are cheapest to refute
+            if med <= 0 and -((-low) // 2) < med:
+                med = -((-low) // 2)
+            elif med >= 0 and high // 2 > med:
+                med = high // 2
+            result = self.negamax(current, mask, moves, med, med + 1)
+            if result <= med:
+                high = result
+            else:
+                low = result
+        return low
+
+    def analyze(self, board, piece, deadline=None, cancel=None):
+        """
+        Score every legal move of a position.
+
+        Args:
+            board (Board): Position to analyze
+            piece (int): Piece of the side to move
+            deadline (float): time.perf_counter() value to give up at, or None
+            cancel (CancellationToken): Token that stops the solve early, or None
+
+        Returns:
+            list: Score per column from the mover's point of view, None for full columns
+
+        Raises:
+            SolverTimeout: If the deadline passes or the token is cancelled before the analysis completes
+        """
+        current, mask, moves = self.position(board, piece)
+        self._deadline = deadline
+        self._cancel = cancel
+        scores = [None] * self.columns
+        symmetric = self.is_symmetric(current, mask)
+        try:
+            for c in self._order:
+                if mask & self._top_masks[c]:
+                    continue
+                mirror = self.columns - 1 - c
+                if symmetric and scores[mirror] is not None:
+                    scores[c] = scores[mirror]
+                    continue
+                scores[c] = self._score_column(current, mask, moves, c)
+        finally:
+            self._deadline = None
+            self._cancel = None
+        return scores
+
+    def score_move(self, board, piece, col, deadline=None, cancel=None):
+        """
+        Compute the exact score of a single legal move.
+
+        Args:
+            board (Board): Position before the move
+            piece (int): Piece of the side to move
+            col (int): Column to play
+            deadline (float): time.perf_counter() value to give up at, or None
+            cancel (CancellationToken): Token that stops the solve early, or None
+
+        Returns:
+            int: Score of the move from the mover's point of view
+
+        Raises:
+            SolverTimeout: If the deadline passes or the token is cancelled before the move is solved
+        """
+        current, mask, moves = self.position(board, piece)
+        self._deadline = deadline
+        self._cancel = cancel
+        try:
+            return self._score_column(current, mask, moves, col)
+        finally:
+            self._deadline = None
+            self._cancel = None
+
+    def _score_column(self, current, mask, moves, col):
+        """
+        Score the move in a column of a position given as bitboards.
+
+        Args:
+            current (int): Stones of the side to move
+            mask (int): All stones on the board
+            moves (int): Number of stones on the board
+            col (int): Column to play (must not be full)
+
+        Returns:
+            int: Score of the move from the mover's point of view
+        """
+        move = (mask + self._bottom_masks[col]) & self._column_masks[col]
+        if self.winning_cells(current, mask) & move:
+            return (self.size + 1 - moves) // 2
+        return -self.solve_position(current ^ mask, mask | move, moves + 1)
+
+    def winning_move(self, board, piece):
+        """
+        Find a move that wins at once, which needs no search.
+
+        Args:
+            board (Board): Current position
+            piece (int): Piece of the side to move
+
+        Returns:
+            tuple: (winning column, score), or None if there is no immediate win
+        """
+        current, mask, moves = self.position(board, piece)
+        wins = self.winning_cells(current, mask) & (mask + self.bottom_mask) & self.board_mask
+        for c in self._order:
+            if wins & self._column_masks[c]:
+                return c, (self.size + 1 - moves) // 2
+        return None
+
+    def best_move(self, board, piece, deadline=None, cancel=None):
+        """
+        Find an optimal move and the game-theoretic value of a position.
+
+        Args:
+            board (Board): Position to solve
+            piece (int): Piece of the side to move
+            deadline (float): time.perf_counter() value to give up at, or None
+            cancel (CancellationToken): Token that stops the solve early, or None
+
+        Returns:
+            tuple: (best column, score), or (None, 0) if the board is full
+
+        Raises:
+            SolverTimeout: If the deadline passes or the token is cancelled before the position is solved
+        """
+        win = self.winning_move(board, piece)
+        if win is not None:
+            return win
+        scores = self.analyze(board, piece, deadline, cancel)
+        best_col, best_score = None, 0
+        for c in self._order:
+            if scores[c] is not None and (best_col is None or scores[c] > best_score):
+                best_col, best_score = c, scores[c]
+        return best_col, best_score
+
+def board_from_moves(moves, rows=6, columns=7):
+    """
+    Build a board from a sequence of 1-based column numbers, the first
+    move played by piece 1.
+
+    Args:
+        moves (str): Column digits, for example "4453"
+        rows (int): Number of rows in the board
+        columns (int): Number of columns in the board
+
+    Returns:
+        tuple: (board, piece of the side to move)
+    """
+    board = Board(rows, columns)
+    piece = 1
+    for ch in moves:
+        col = int(ch) - 1
+        if not board.is_valid_location(col) or board.is_terminal_node():
+            raise ValueError(f"Invalid move sequence: {moves}")
+        board.play(col, piece)
+        piece = 3 - piece
+    return board, piece
+
+def main():
+    """
+    Solve each position read from standard input and print its score and best move.
+    """
+    solver = Solver()
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        moves = line.split()[0]
+        board, piece = board_from_moves(moves)
+        solver.nodes = 0
+        start = time.perf_counter()
+        col, score = solver.best_move(board, piece)
+        elapsed = time.perf_counter() - start
+        print(f"{moves} {score} {col} {solver.nodes} {elapsed:.3f}")
+        sys.stdout.flush()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,8 @@
+"""
+Shared test setup: makes the flat modules at the repository root importable.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
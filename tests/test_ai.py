@@ -0,0 +1,72 @@
+"""
+Tests for the AI player's move choice.
+"""
+
+import math
+import random
+import pytest
+from ai import AIPlayer, RandomizedAIPlayer
+from board import Board
+
+def root_scores(board, piece, depth):
+    """
+    Score every root move with a full window, so each score is exact.
+    """
+    scores = {}
+    for col in board.get_valid_locations():
+        player = AIPlayer("hard", piece=piece, book_path=None, workers=1)
+        player.new_search(board)
+        board.play(col, piece)
+        scores[col] = player.minimax(board, depth - 1, -math.inf, math.inf, False, 1)[1]
+        board.undo()
+    return scores
+
+def random_position(rng, max_moves):
+    board = Board()
+    piece = 1
+    for _ in range(rng.randrange(max_moves)):
+        board.play(rng.choice(board.get_valid_locations()), piece)
+        piece = 3 - piece
+        if board.is_terminal_node():
+            return random_position(rng, max_moves)
+    return board, piece
+
+@pytest.mark.parametrize("seed", range(12))
+def test_randomized_player_only_picks_best_moves(seed):
+    rng = random.Random(seed)
+    board, piece = random_position(rng, 14)
+    scores = root_scores(board, piece, 5)
+    best = max(scores.values())
+    for _ in range(5):
+        player = RandomizedAIPlayer("hard", piece=piece, book_path=None, workers=1)
+        player.new_search(board)
+        col, value = player.minimax(board.copy(), 5, -math.inf, math.inf, True)
+        assert value == best
+        assert scores[col] == best
+
+def tied_position():
+    # After a center opening the reply is symmetric, and at depth 4 three moves tie
+    board = Board()
+    board.play(3, 1)
+    scores = root_scores(board, 2, 4)
+    best = {col for col, score in scores.items() if score == max(scores.values())}
+    assert len(best) > 1
+    return board, best
+
+def test_randomized_player_varies_between_tied_moves():
+    board, best = tied_position()
+    random.seed(0)
+    chosen = set()
+    for _ in range(30):
+        player = RandomizedAIPlayer("hard", piece=2, book_path=None, workers=1)
+        player.new_search(board)
+        chosen.add(player.minimax(board.copy(), 4, -math.inf, math.inf, True)[0])
+    assert chosen == best
+
+def test_root_table_hit_still_randomizes():
+    # Each search leaves an exact root entry that would answer the next search at once
+    board, best = tied_position()
+    random.seed(1)
+    player = RandomizedAIPlayer("hard", piece=2, book_path=None, workers=1)
+    chosen = {player.iterative_deepening(board, 4, math.inf) for _ in range(30)}
+    assert chosen == best
@@ -0,0 +1,155 @@
+"""
+Tests for the bitboard Board against a plain 2D reference board.
+"""
+
+import random
+import pytest
+from board import Board
+
+ROWS, COLUMNS = 6, 7
+
+class ReferenceBoard:
+    """
+    The original grid representation: a list of rows, row 0 at the bottom.
+    """
+
+    def __init__(self, rows=ROWS, columns=COLUMNS):
+        self.rows = rows
+        self.columns = columns
+        self.grid = [[0] * columns for _ in range(rows)]
+
+    def drop(self, col, piece):
+        for r in range(self.rows):
+            if self.grid[r][col] == 0:
+                self.grid[r][col] = piece
+                return r
+        raise ValueError("column is full")
+
+    def valid_columns(self):
+        return [c for c in range(self.columns) if self.grid[self.rows - 1][c] == 0]
+
+    def wins(self, piece):
+        g = self.grid
+        for r in range(self.rows):
+            for c in range(self.columns):
+                for dr, dc in ((0, 1), (1, 0), (1, 1), (-1, 1)):
+                    cells = [(r + i * dr, c + i * dc) for i in range(4)]
+                    if all(0 <= y < self.rows and 0 <= x < self.columns and g[y][x] == piece for y, x in cells):
+                        return True
+        return False
+
+def random_games(count, seed):
+    """
+    Yield the (column, piece) moves of random games played until a win or a full board.
+    """
+    rng = random.Random(seed)
+    for _ in range(count):
+        board = Board(ROWS, COLUMNS)
+        moves = []
+        while not board.is_terminal_node():
+            col = rng.choice(board.get_valid_locations())
+            moves.append((col, 1 + board.move_count % 2))
+            board.play(col, moves[-1][1])
+        yield moves
+
+@pytest.mark.parametrize("seed", range(3))
+def test_bitboard_matches_reference_board(seed):
+    for moves in random_games(40, seed):
+        board = Board(ROWS, COLUMNS)
+        reference = ReferenceBoard()
+        for col, piece in moves:
+            row = reference.drop(col, piece)
+            assert board.get_next_open_row(col) == row
+            board.drop_piece(row, col, piece)
+            assert board.board.tolist() == reference.grid
+            assert board.get_valid_locations() == reference.valid_columns()
+            for p in (1, 2):
+                assert board.winning_move(p) == reference.wins(p)
+            assert board.is_full() == (not reference.valid_columns())
+
+def test_copy_is_independent():
+    board = Board()
+    board.play(3, 1)
+    copy = board.copy()
+    copy.play(3, 2)
+    assert board.move_count == 1 and copy.move_count == 2
+    assert board.board[1][3] == 0 and copy.board[1][3] == 2
+
+def reference_score(board, grid, piece):
+    """
+    The original score_position: evaluate_window over every window of the grid.
+    """
+    score = [grid[r][COLUMNS // 2] for r in range(ROWS)].count(piece) * 3
+    for r in range(ROWS):
+        for c in range(COLUMNS):
+            for dr, dc in ((0, 1), (1, 0), (1, 1), (-1, 1)):
+                cells = [(r + i * dr, c + i * dc) for i in range(4)]
+                if all(0 <= y < ROWS and 0 <= x < COLUMNS for y, x in cells):
+                    score += board.evaluate_window([grid[y][x] for y, x in cells], piece)
+    return score
+
+@pytest.mark.parametrize("seed", range(2))
+def test_evaluate_position_matches_window_scoring(seed):
+    for moves in random_games(20, seed):
+        board = Board(ROWS, COLUMNS)
+        reference = ReferenceBoard()
+        for col, piece in moves:
+            board.play(col, piece)
+            reference.drop(col, piece)
+            for p in (1, 2):
+                assert board.evaluate_position(p) == reference_score(board, reference.grid, p)
+
+@pytest.mark.parametrize("seed", range(2))
+def test_incremental_score_matches_full_score_through_play_and_undo(seed):
+    for moves in random_games(30, seed):
+        board = Board(ROWS, COLUMNS)
+        snapshots = []
+        for col, piece in moves:
+            snapshots.append((board.hash, board.scores[:], board.window_codes[:]))
+            board.play(col, piece)
+            for p in (1, 2):
+                assert board.score_position(p) == board.evaluate_position(p)
+        while board.history:
+            board.undo()
+            assert (board.hash, board.scores, board.window_codes) == snapshots.pop()
+            for p in (1, 2):
+                assert board.score_position(p) == board.evaluate_position(p)
+        assert board.hash == 0 and board.move_count == 0
+
+@pytest.mark.parametrize("seed", range(3))
+def test_incremental_win_detection_matches_full_check(seed):
+    for moves in random_games(40, seed):
+        board = Board(ROWS, COLUMNS)
+        for col, piece in moves:
+            board.play(col, piece)
+            assert board.last_move == (col, piece)
+            for p in (1, 2):
+                assert board.winning_move(p) == board.has_four(p)
+        while board.history:
+            board.undo()
+            for p in (1, 2):
+                assert board.winning_move(p) == board.has_four(p)
+            assert board.is_terminal_node() == (board.has_four(1) or board.has_four(2) or board.is_full())
+
+@pytest.mark.parametrize("seed", range(2))
+def test_move_generation_tracks_column_heights(seed):
+    for moves in random_games(30, seed):
+        board = Board(ROWS, COLUMNS)
+        for col, piece in moves + [(None, None)]:
+            expected = [c for c in range(COLUMNS) if board.heights[c] < ROWS]
+            assert board.get_valid_locations() == expected
+            assert list(board.iter_valid_locations()) == expected
+            assert all(board.is_valid_location(c) == (c in expected) for c in range(-1, COLUMNS + 1))
+            if col is not None:
+                board.play(col, piece)
+        while board.history:
+            board.undo()
+            assert board.get_valid_locations() == [c for c in range(COLUMNS) if board.heights[c] < ROWS]
+
+def test_full_column_is_not_a_valid_location():
+    board = Board(ROWS, COLUMNS)
+    for i in range(ROWS):
+        board.play(0, 1 + i % 2)
+    assert not board.is_valid_location(0)
+    assert board.get_next_open_row(0) == -1
+    assert 0 not in board.get_valid_locations()
@@ -0,0 +1,94 @@
+"""
+Tests for opening book keys, lookups with mirroring and the exact-entry filter.
+"""
+
+import random
+from ai import AIPlayer
+from board import Board
+from opening_book import (BOOK_MAGIC, BOOK_VERSION, ENTRY, FLAG_EXACT, HEADER, OpeningBook, build_book,
+                          canonical_key, enumerate_positions, mirror_key, position_key)
+
+def board_from(moves):
+    """
+    Play 0-based column digits from the empty board.
+    """
+    board = Board()
+    piece = 1
+    for ch in moves:
+        board.play(int(ch), piece)
+        piece = 3 - piece
+    return board, piece
+
+def mirrored(moves, columns=7):
+    return "".join(str(columns - 1 - int(ch)) for ch in moves)
+
+def write_book(path, entries, max_ply=4):
+    """
+    Write a book file from (board, piece, move, score, flags) entries.
+    """
+    packed = {}
+    for board, piece, move, score, flags in entries:
+        key, is_mirror = canonical_key(board, piece)
+        packed[key] = (board.columns - 1 - move if is_mirror else move, score, flags)
+    with open(path, "wb") as file:
+        file.write(HEADER.pack(BOOK_MAGIC, BOOK_VERSION, 6, 7, max_ply, len(packed)))
+        for key in sorted(packed):
+            file.write(ENTRY.pack(key, *packed[key]))
+
+def test_position_keys_are_unique_and_mirror_consistently():
+    rng = random.Random(3)
+    seen = {}
+    for _ in range(300):
+        # At most six stones, so no column overflows and no game is over
+        moves = "".join(str(rng.randrange(7)) for _ in range(rng.randrange(7)))
+        board, piece = board_from(moves)
+        key = position_key(board, piece)
+        assert seen.setdefault(key, board.board.tolist()) == board.board.tolist()
+        mirror_board, mirror_piece = board_from(mirrored(moves))
+        assert mirror_key(key, 6, 7) == position_key(mirror_board, mirror_piece)
+        assert mirror_key(mirror_key(key, 6, 7), 6, 7) == key
+        assert canonical_key(board, piece)[0] == canonical_key(mirror_board, mirror_piece)[0]
+
+def test_enumerate_positions_folds_mirror_images():
+    assert [len(enumerate_positions(ply)) for ply in range(4)] == [1, 5, 30, 151]
+
+def test_lookup_mirrors_the_stored_move(tmp_path):
+    path = str(tmp_path / "book.bin")
+    board, piece = board_from("01")
+    write_book(path, [(board, piece, 2, 3, FLAG_EXACT)])
+    book = OpeningBook(path)
+    try:
+        assert book.lookup(board, piece) == (2, 3, True)
+        mirror_board, mirror_piece = board_from(mirrored("01"))
+        assert book.lookup(mirror_board, mirror_piece) == (4, 3, True)
+        assert book.lookup(*board_from("02")) is None
+        assert book.lookup(*board_from("01234")) is None  # Deeper than the book's max ply
+    finally:
+        book.close()
+
+def test_built_book_answers_every_position_and_its_mirror(tmp_path):
+    path = str(tmp_path / "book.bin")
+    count = build_book(path, 2, depth=2, solve_time=0.01, workers=1)
+    assert count == len(enumerate_positions(2))
+    book = OpeningBook(path)
+    try:
+        for _, moves in enumerate_positions(2):
+            board, piece = board_from(moves)
+            col, _, _ = book.lookup(board, piece)
+            assert board.is_valid_location(col)
+            mirror_board, mirror_piece = board_from(mirrored(moves))
+            assert book.lookup(mirror_board, mirror_piece)[0] == 6 - col
+    finally:
+        book.close()
+
+def test_exact_levels_skip_inexact_entries(tmp_path):
+    path = str(tmp_path / "book.bin")
+    solved, solved_piece = board_from("3")
+    guessed, guessed_piece = board_from("33")
+    write_book(path, [(solved, solved_piece, 3, 1, FLAG_EXACT), (guessed, guessed_piece, 2, 0, 0)])
+    player = AIPlayer("perfect", piece=solved_piece, book_path=path, workers=1)
+    assert player.book_move(solved, exact=True) == 3
+    assert player.solved_score == 1
+    player = AIPlayer("perfect", piece=guessed_piece, book_path=path, workers=1)
+    assert player.book_move(guessed, exact=True) is None
+    assert player.book_move(guessed) == 2
@@ -0,0 +1,106 @@
+"""
+Tests for the Elo conversions, the SPRT and the Bradley-Terry rating fit.
+"""
+
+import math
+import pytest
+from ratings import SPRT, MatchStats, RatingTable, elo_from_score, expected_score
+
+# 400 * log10(3): the gap at which the stronger player scores 75%
+ELO_75 = 190.8485018878650
+
+def play(table, player, opponent, wins, draws, losses):
+    for result, count in (("win", wins), ("draw", draws), ("loss", losses)):
+        for _ in range(count):
+            table.add_game(player, opponent, result)
+
+def test_elo_conversions():
+    assert expected_score(0) == 0.5
+    assert expected_score(400) == pytest.approx(10 / 11)
+    assert expected_score(-ELO_75) == pytest.approx(0.25)
+    assert elo_from_score(0.75) == pytest.approx(ELO_75)
+    assert elo_from_score(0.5) == 0
+    assert elo_from_score(0) == -math.inf
+    assert elo_from_score(1) == math.inf
+    for diff in (-300, -42.5, 0, 17, 250):
+        assert elo_from_score(expected_score(diff)) == pytest.approx(diff)
+
+def test_match_stats():
+    stats = MatchStats(60, 20, 20)
+    assert stats.games == 100
+    assert stats.score == pytest.approx(0.7)
+    assert stats.score_variance() == pytest.approx(0.16)
+    elo, low, high = stats.elo()
+    assert elo == pytest.approx(elo_from_score(0.7))
+    margin = 1.959964 * math.sqrt(0.16 / 100)
+    assert low == pytest.approx(elo_from_score(0.7 - margin))
+    assert high == pytest.approx(elo_from_score(0.7 + margin))
+    assert MatchStats().score == 0.5
+
+def test_sprt_bounds():
+    sprt = SPRT(0, 5, alpha=0.05, beta=0.05)
+    assert sprt.lower == pytest.approx(math.log(0.05 / 0.95))
+    assert sprt.upper == pytest.approx(math.log(0.95 / 0.05))
+    sprt = SPRT(0, 5, alpha=0.01, beta=0.1)
+    assert sprt.lower == pytest.approx(math.log(0.1 / 0.99))
+    assert sprt.upper == pytest.approx(math.log(0.9 / 0.01))
+
+def test_sprt_llr():
+    # n (s1 - s0) (2 s - s0 - s1) / (2 var) with s = 0.7, var = 0.16,
+    # s0 = 0.5 and s1 = expected_score(100)
+    sprt = SPRT(0, 100)
+    assert sprt.llr(MatchStats(60, 20, 20)) == pytest.approx(11.377436172303694)
+    assert sprt.llr(MatchStats()) == 0
+
+def test_sprt_decisions():
+    sprt = SPRT(0, 50)
+    assert sprt.decision(MatchStats(60, 20, 20)) == "H1"
+    assert sprt.decision(MatchStats(20, 20, 60)) == "H0"
+    assert sprt.decision(MatchStats(3, 2, 2)) is None
+    # Results that never vary still reach a verdict
+    assert sprt.decision(MatchStats(wins=40)) == "H1"
+    assert sprt.decision(MatchStats(losses=40)) == "H0"
+
+def test_bradley_terry_recovers_known_gaps():
+    # Results that fit the model exactly: A is ELO_75 above B and B is ELO_75
+    # above C, so A scores expected_score(2 * ELO_75) = 90% against C
+    table = RatingTable(prior_draws=0)
+    play(table, "A", "B", 75, 0, 25)
+    play(table, "B", "C", 75, 0, 25)
+    play(table, "A", "C", 90, 0, 10)
+    ratings = {name: (elo, margin, games) for name, elo, margin, games in table.ratings()}
+    assert [row[0] for row in table.ratings()] == ["A", "B", "C"]
+    assert ratings["A"][0] == pytest.approx(ELO_75, abs=1e-4)
+    assert ratings["B"][0] == pytest.approx(0, abs=1e-4)
+    assert ratings["C"][0] == pytest.approx(-ELO_75, abs=1e-4)
+    assert all(games == 200 for _, _, games in ratings.values())
+    assert ratings["A"][1] == pytest.approx(ratings["C"][1])
+
+def test_bradley_terry_symmetric_results():
+    table = RatingTable()
+    play(table, "A", "B", 10, 5, 10)
+    play(table, "B", "C", 7, 0, 7)
+    play(table, "C", "A", 3, 8, 3)
+    for _, elo, margin, _ in table.ratings():
+        assert elo == pytest.approx(0, abs=1e-6)
+        assert 0 < margin < math.inf
+
+def test_error_bars_shrink_with_games():
+    margins = []
+    for games in (24, 96):
+        table = RatingTable(prior_draws=0)
+        play(table, "A", "B", 3 * games // 4, 0, games // 4)
+        margins.append(table.ratings()[0][2])
+    assert margins[1] == pytest.approx(margins[0] / 2, rel=1e-3)
+
+def test_prior_draws_keep_unbeaten_players_finite():
+    table = RatingTable()
+    play(table, "A", "B", 10, 0, 0)
+    (top, top_elo, _, _), (_, bottom_elo, _, _) = table.ratings()
+    assert top == "A"
+    assert math.isfinite(top_elo) and top_elo > 0
+    assert bottom_elo == pytest.approx(-top_elo)
+
+def test_unknown_result():
+    with pytest.raises(ValueError):
+        RatingTable().add_game("A", "B", "forfeit")
@@ -0,0 +1,86 @@
+"""
+Tests for the exact solver against a brute-force minimax on endgames.
+"""
+
+import random
+import pytest
+from board import Board
+from solver import Solver, SolverTimeout, board_from_moves
+
+def brute_force_score(board, piece):
+    """
+    Score a position by searching every continuation, in the solver's convention:
+    a win with the n-th stone scores (size + 1 - stones before it) // 2.
+    """
+    size = board.rows * board.columns
+    valid = board.get_valid_locations()
+    for col in valid:
+        board.play(col, piece)
+        won = board.winning_move(piece)
+        board.undo()
+        if won:
+            return (size + 1 - board.move_count) // 2
+    if not valid:
+        return 0
+    best = -size
+    for col in valid:
+        board.play(col, piece)
+        best = max(best, -brute_force_score(board, 3 - piece))
+        board.undo()
+    return best
+
+def random_endgames(count, empty, seed):
+    """
+    Yield (board, piece to move) for random non-terminal positions with a given number of empty cells.
+    """
+    rng = random.Random(seed)
+    found = 0
+    while found < count:
+        board = Board()
+        piece = 1
+        while board.move_count < board.rows * board.columns - empty and not board.is_terminal_node():
+            board.play(rng.choice(board.get_valid_locations()), piece)
+            piece = 3 - piece
+        if not board.is_terminal_node():
+            found += 1
+            yield board, piece
+
+@pytest.mark.parametrize("empty", [4, 6, 8])
+def test_solver_matches_brute_force(empty):
+    solver = Solver()
+    for board, piece in random_endgames(15, empty, seed=empty):
+        expected = brute_force_score(board, piece)
+        col, score = solver.best_move(board, piece)
+        assert score == expected
+        board.play(col, piece)
+        # The chosen move must achieve the position's score
+        achieved = (board.rows * board.columns + 2 - board.move_count) // 2 if board.winning_move(piece) \
+            else -brute_force_score(board, 3 - piece)
+        board.undo()
+        assert achieved == expected
+
+def test_analyze_scores_every_column():
+    solver = Solver()
+    for board, piece in random_endgames(10, 7, seed=1):
+        scores = solver.analyze(board, piece)
+        for col in range(board.columns):
+            if not board.is_valid_location(col):
+                assert scores[col] is None
+                continue
+            board.play(col, piece)
+            expected = (board.rows * board.columns + 2 - board.move_count) // 2 if board.winning_move(piece) \
+                else -brute_force_score(board, 3 - piece)
+            board.undo()
+            assert scores[col] == expected == solver.score_move(board, piece, col)
+
+def test_winning_move_is_found_without_search():
+    board, piece = board_from_moves("4455443376")
+    solver = Solver()
+    assert solver.winning_move(board, piece) == (1, 16)
+    assert solver.best_move(board, piece) == (1, 16)
+    assert solver.nodes == 0
+
+def test_expired_deadline_raises_timeout():
+    board, piece = board_from_moves("44")
+    with pytest.raises(SolverTimeout):
+        Solver().best_move(board, piece, deadline=0)
@@ -0,0 +1,110 @@
+"""
+Tests for the transposition tables and the keys the AI stores its results under.
+"""
+
+import math
+import multiprocessing
+import pytest
+from ai import AIPlayer
+from solver import board_from_moves
+from transposition import EXACT, LOWER_BOUND, UPPER_BOUND, SharedTranspositionTable, TranspositionTable
+
+def store_in_child(table, entries):
+    """
+    Store entries into a shared table from another process.
+    """
+    for entry in entries:
+        table.store(*entry)
+    table.close()
+
+@pytest.fixture
+def shared_table():
+    table = SharedTranspositionTable(1)
+    yield table
+    table.close()
+    table.unlink()
+
+@pytest.fixture(params=["local", "shared"])
+def table(request, shared_table):
+    return TranspositionTable(1) if request.param == "local" else shared_table
+
+def test_store_then_probe(table):
+    assert table.probe(12345) is None
+    table.store(12345, 7, LOWER_BOUND, -250, 3)
+    assert table.probe(12345) == (12345, 7, LOWER_BOUND, -250, 3)
+    table.store(999, 2, UPPER_BOUND, 1000000, None)
+    assert table.probe(999) == (999, 2, UPPER_BOUND, 1000000, None)
+    assert table.hits == 2
+    assert table.stores == 2
+
+def test_same_position_is_replaced(table):
+    table.store(42, 6, EXACT, 10, 1)
+    table.store(42, 3, UPPER_BOUND, -5, 4)
+    assert table.probe(42) == (42, 3, UPPER_BOUND, -5, 4)
+
+def test_bucket_keeps_deepest_and_most_recent(table):
+    # Keys a multiple of the table size apart share a bucket
+    first, second, third = 5, 5 + table.size, 5 + 2 * table.size
+    table.store(first, 8, EXACT, 1, 0)
+    table.store(second, 2, EXACT, 2, 1)
+    assert table.probe(first)[1] == 8
+    assert table.probe(second)[1] == 2
+
+    # A shallower entry goes to the always-replace slot and keeps the deep one
+    table.store(third, 1, EXACT, 3, 2)
+    assert table.probe(first) is not None
+    assert table.probe(second) is None
+    assert table.probe(third) is not None
+
+    # A deeper entry takes the deep slot and demotes the old deep entry
+    table.store(second, 9, EXACT, 4, 3)
+    assert table.probe(second)[1] == 9
+    assert table.probe(first)[1] == 8
+    assert table.probe(third) is None
+
+def test_clear(table):
+    table.store(7, 1, EXACT, 0, 0)
+    table.clear()
+    assert table.probe(7) is None
+    assert table.hits == 0 and table.stores == 0
+
+def test_shared_counters(shared_table):
+    key = 3
+    other = 3 + shared_table.size
+    shared_table.store(key, 1, EXACT, 0, 0)
+    shared_table.store(other, 4, EXACT, 0, 0)
+    shared_table.store(other + shared_table.size, 0, EXACT, 0, 0)
+    # The deep slot was rewritten over key, then key was evicted from the recent slot
+    assert shared_table.overwrites == 2
+    assert shared_table.probe(key + 3 * shared_table.size) is None
+    assert shared_table.collisions == 1
+
+def test_shared_table_across_processes(shared_table):
+    entries = [(key * 7919, key % 20, key % 3, key - 50, key % 7) for key in range(1, 100)]
+    process = multiprocessing.get_context("spawn").Process(target=store_in_child, args=(shared_table, entries))
+    process.start()
+    process.join(60)
+    assert process.exitcode == 0
+    for entry in entries:
+        assert shared_table.probe(entry[0]) == entry
+
+def test_torn_slot_reads_as_miss(shared_table):
+    shared_table.store(77, 5, EXACT, 12, 2)
+    base = (77 & (shared_table.size - 1)) * 4
+    # A concurrent writer replaced the data word but not the check word
+    shared_table._words[base + 1] ^= 1 << 33
+    assert shared_table.probe(77) is None
+
+@pytest.mark.parametrize("moves", ["3455", "444343", "12344321", "5624727721", "44741244532746"])
+def test_players_do_not_share_entries(shared_table, moves):
+    # Both pieces search the same position through one shared table, as the
+    # pool's workers do; each must get the score a fresh table would give it
+    board, piece = board_from_moves(moves)
+    scores = []
+    for searcher, table in ((piece, shared_table), (3 - piece, shared_table), (3 - piece, None)):
+        player = AIPlayer("hard", piece=searcher, book_path=None, workers=1)
+        if table is not None:
+            player.tt = table
+        player.new_search(board)
+        scores.append(player.minimax(board.copy(), 5, -math.inf, math.inf, True)[1])
+    assert scores[1] == scores[2]
@@ -0,0 +1,338 @@
+"""
+Headless AI vs AI tournament runner for Connect Four.
+Plays many games between two AI player configurations across a process pool
+and reports results as games finish, without pygame or any delays between moves.
+
+Player configurations are written as a difficulty level optionally followed by
+settings, for example "hard", "medium:time_limit=0.05",
+"medium:node_limit=5000" or "hard:randomized=1,tt_size_mb=8". Colors alternate every game, and each
+opening from an openings file is played once with each color. With --sprt the
+tournament stops as soon as a sequential test of player A against player B
+reaches a decision.
+
+Example:
+    python tournament.py hard:time_limit=0.1 medium --games 200 --workers 8
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from ai import AIPlayer, RandomizedAIPlayer, DIFFICULTY_SETTINGS
+from ratings import SPRT, MatchStats
+from solver import board_from_moves
+
+# Settings a player configuration may override, with their types
+PLAYER_OPTIONS = {
+    "time_limit": float,
+    "node_limit": int,
+    "tt_size_mb": float,
+    "randomized": lambda value: value.lower() in ("1", "true", "yes"),
+}
+
+def parse_player(spec):
+    """
+    Parse a player configuration string.
+
+    Args:
+        spec (str): Difficulty level, optionally followed by ":key=value,..."
+
+    Returns:
+        dict: Player configuration with at least "difficulty" and "name"
+
+    Raises:
+        ValueError: If the difficulty or a setting is unknown
+    """
+    difficulty, _, options = spec.partition(":")
+    if difficulty not in DIFFICULTY_SETTINGS:
+        raise ValueError(f"Unknown difficulty: {difficulty}")
+    config = {"difficulty": difficulty, "name": spec}
+    for option in filter(None, options.split(",")):
+        key, _, value = option.partition("=")
+        if key not in PLAYER_OPTIONS:
+            raise ValueError(f"Unknown player setting: {key}")
+        config[key] = PLAYER_OPTIONS[key](value)
+    return config
+
+def make_player(config, piece):
+    """
+    Create an AI player from a configuration.
+    Players search on a single process: the tournament itself fills the cores.
+
+    Args:
+        config (dict): Player configuration from parse_player
+        piece (int): Piece the player moves with
+
+    Returns:
+        AIPlayer: The configured player
+    """
+    player_class = RandomizedAIPlayer if config.get("randomized") else AIPlayer
+    return player_class(config["difficulty"], tt_size_mb=config.get("tt_size_mb", 16),
+                        time_limit=config.get("time_limit"), piece=piece, workers=1,
+                        node_limit=config.get("node_limit"))
+
+def play_game(game, config_a, config_b, opening, a_piece):
+    """
+    Play one game to the end.
+
+    Args:
+        game (int): Index of the game in the tournament
+        config_a (dict): Configuration of player A
+        config_b (dict): Configuration of player B
+        opening (str): 1-based column digits played before the AIs take over
+        a_piece (int): Piece player A moves with (1 moves first)
+
+    Returns:
+        dict: Game record with the result from player A's point of view
+            ("win", "draw" or "loss"), the number of moves and each player's
+            total think time, nodes searched and move count
+    """
+    board, piece = board_from_moves(opening)
+    players = {a_piece: make_player(config_a, a_piece), 3 - a_piece: make_player(config_b, 3 - a_piece)}
+    think_time = {1: 0.0, 2: 0.0}
+    nodes = {1: 0, 2: 0}
+    moves = {1: 0, 2: 0}
+    forfeit = None
+    while not board.is_terminal_node():
+        start = time.perf_counter()
+        col = players[piece].get_move(board)
+        think_time[piece] += time.perf_counter() - start
+        nodes[piece] += players[piece].nodes
+        moves[piece] += 1
+        if col is None or not board.is_valid_location(col):
+            forfeit = piece
+            break
+        board.play(col, piece)
+        piece = 3 - piece
+    if forfeit is not None:
+        winner = 3 - forfeit
+    elif board.winning_move(1):
+        winner = 1
+    elif board.winning_move(2):
+        winner = 2
+    else:
+        winner = 0
+    result = "draw" if winner == 0 else "win" if winner == a_piece else "loss"
+    b_piece = 3 - a_piece
+    return {
+        "game": game,
+        "opening": opening,
+        "a_piece": a_piece,
+        "result": result,
+        "moves": board.move_count,
+        "forfeit": forfeit is not None,
+        "a_time": think_time[a_piece],
+        "a_nodes": nodes[a_piece],
+        "a_moves": moves[a_piece],
+        "b_time": think_time[b_piece],
+        "b_nodes": nodes[b_piece],
+        "b_moves": moves[b_piece],
+    }
+
+def schedule(games, openings):
+    """
+    Assign an opening and colors to every game.
+    Consecutive pairs of games share an opening with the colors swapped.
+
+    Args:
+        games (int): Number of games
+        openings (list): Opening move strings (empty for the empty board)
+
+    Returns:
+        list: (game index, opening, piece of player A) tuples
+    """
+    openings = openings or [""]
+    return [(i, openings[(i // 2) % len(openings)], 1 if i % 2 == 0 else 2) for i in range(games)]
+
+def run_tournament(config_a, config_b, games, openings=None, workers=None):
+    """
+    Play a tournament across a process pool, yielding each game as it finishes.
+
+    Args:
+        config_a (dict): Configuration of player A
+        config_b (dict): Configuration of player B
+        games (int): Number of games to play
+        openings (list): Opening move strings, or None to start every game from the empty board
+        workers (int): Worker processes (default: one per CPU)
+
+    Yields:
+        dict: Game records from play_game, in completion order; games not yet
+            started are cancelled when the caller stops iterating
+    """
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(play_game, game, config_a, config_b, opening, a_piece)
+                   for game, opening, a_piece in schedule(games, openings)]
+        try:
+            for future in as_completed(futures):
+                yield future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+
+class TournamentSummary:
+    """
+    Running totals of a tournament from player A's point of view.
+    """
+
+    def __init__(self):
+        self.wins = 0
+        self.draws = 0
+        self.losses = 0
+        self.forfeits = 0
+        self.a_time = 0.0
+        self.a_nodes = 0
+        self.a_moves = 0
+        self.b_time = 0.0
+        self.b_nodes = 0
+        self.b_moves = 0
+
+    def add(self, record):
+        """
+        Add a finished game.
+
+        Args:
+            record (dict): Game record from play_game
+        """
+        if record["result"] == "win":
+            self.wins += 1
+        elif record["result"] == "draw":
+            self.draws += 1
+        else:
+            self.losses += 1
+        self.forfeits += record["forfeit"]
+        self.a_time += record["a_time"]
+        self.a_nodes += record["a_nodes"]
+        self.a_moves += record["a_moves"]
+        self.b_time += record["b_time"]
+        self.b_nodes += record["b_nodes"]
+        self.b_moves += record["b_moves"]
+
+    @property
+    def games(self):
+        return self.wins + self.draws + self.losses
+
+    @property
+    def score(self):
+        """
+        Player A's score rate, counting a draw as half a win.
+
+        Returns:
+            float: Value between 0 and 1 (0 before any game finished)
+        """
+        return (self.wins + self.draws / 2) / self.games if self.games else 0.0
+
+    def average_think_times(self):
+        """
+        Average time per move of each player.
+
+        Returns:
+            tuple: (player A seconds per move, player B seconds per move)
+        """
+        return (self.a_time / self.a_moves if self.a_moves else 0.0,
+                self.b_time / self.b_moves if self.b_moves else 0.0)
+
+    def average_nodes(self):
+        """
+        Average nodes searched per move by each player.
+
+        Returns:
+            tuple: (player A nodes per move, player B nodes per move)
+        """
+        return (self.a_nodes / self.a_moves if self.a_moves else 0.0,
+                self.b_nodes / self.b_moves if self.b_moves else 0.0)
+
+def load_openings(path):
+    """
+    Read opening positions, one sequence of 1-based column digits per line.
+    Blank lines and lines starting with "#" are skipped.
+
+    Args:
+        path (str): Path of the openings file
+
+    Returns:
+        list: Opening move strings
+
+    Raises:
+        ValueError: If a line is not a legal, unfinished move sequence
+    """
+    openings = []
+    with open(path, "r") as file:
+        for line in file:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            board, _ = board_from_moves(line)
+            if board.is_terminal_node():
+                raise ValueError(f"Opening is already decided: {line}")
+            openings.append(line)
+    return openings
+
+def main():
+    """
+    Command line entry point: run a tournament and stream the results.
+    """
+    parser = argparse.ArgumentParser(description="Play a headless AI vs AI Connect Four tournament.")
+    parser.add_argument("player_a", type=parse_player, help='player A, e.g. "hard:time_limit=0.1"')
+    parser.add_argument("player_b", type=parse_player, help='player B, e.g. "medium:randomized=1"')
+    parser.add_argument("--games", type=int, default=100, help="number of games")
+    parser.add_argument("--openings", help="file of opening move sequences")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: one per CPU)")
+    parser.add_argument("--jsonl", help="also append every game record to this file as JSON")
+    parser.add_argument("--sprt", nargs=2, type=float, metavar=("ELO0", "ELO1"),
+                        help="stop once an SPRT of player A against player B accepts ELO0 or ELO1")
+    parser.add_argument("--alpha", type=float, default=0.05, help="SPRT false positive rate")
+    parser.add_argument("--beta", type=float, default=0.05, help="SPRT false negative rate")
+    args = parser.parse_args()
+
+    openings = load_openings(args.openings) if args.openings else None
+    name_a, name_b = args.player_a["name"], args.player_b["name"]
+    summary = TournamentSummary()
+    sprt = SPRT(args.sprt[0], args.sprt[1], args.alpha, args.beta) if args.sprt else None
+    decision = None
+    records = open(args.jsonl, "a") if args.jsonl else None
+    start = time.perf_counter()
+    try:
+        for record in run_tournament(args.player_a, args.player_b, args.games, openings, args.workers):
+            summary.add(record)
+            colors = f"{name_a} first" if record["a_piece"] == 1 else f"{name_b} first"
+            line = (f"game {record['game'] + 1}: {record['result']} for {name_a} "
+                    f"({colors}, opening '{record['opening']}', {record['moves']} moves) | "
+                    f"+{summary.wins} ={summary.draws} -{summary.losses}")
+            if sprt:
+                stats = MatchStats(summary.wins, summary.draws, summary.losses)
+                line += f" | LLR {sprt.llr(stats):.2f}"
+                decision = sprt.decision(stats)
+            print(line)
+            sys.stdout.flush()
+            if records:
+                records.write(json.dumps(dict(record, player_a=name_a, player_b=name_b)) + "\n")
+                records.flush()
+            if decision:
+                break
+    finally:
+        if records:
+            records.close()
+
+    elapsed = time.perf_counter() - start
+    time_a, time_b = summary.average_think_times()
+    print()
+    print(f"{name_a} vs {name_b}: {summary.games} games, "
+          f"+{summary.wins} ={summary.draws} -{summary.losses} "
+          f"(score {summary.score:.1%}, {summary.forfeits} forfeits)")
+    nodes_a, nodes_b = summary.average_nodes()
+    print(f"Average think time per move: {name_a} {time_a * 1000:.1f} ms, {name_b} {time_b * 1000:.1f} ms")
+    print(f"Average nodes per move: {name_a} {nodes_a:.0f}, {name_b} {nodes_b:.0f}")
+    print(f"Throughput: {summary.games / elapsed * 3600:.0f} games per hour "
+          f"on {args.workers or os.cpu_count()} workers")
+    if sprt:
+        elo, low, high = MatchStats(summary.wins, summary.draws, summary.losses).elo()
+        print(f"Elo difference: {elo:.1f} [{low:.1f}, {high:.1f}]")
+        verdict = {"H1": f"accepted H1 ({name_a} is at least {sprt.elo1:g} Elo stronger)",
+                   "H0": f"accepted H0 ({name_a} is at most {sprt.elo0:g} Elo stronger)",
+                   None: "no decision yet"}[decision]
+        print(f"SPRT [{sprt.elo0:g}, {sprt.elo1:g}]: {verdict}")
+
+if __name__ == "__main__":
+    main()
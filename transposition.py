@@ -0,0 +1,248 @@
+"""
+Transposition table module for the Connect Four AI.
+Caches search results by Zobrist hash so transposed move orders are only searched once.
+"""
+
+from multiprocessing import shared_memory
+
+# Bound types stored with each entry
+EXACT = 0        # Value is the exact minimax score
+LOWER_BOUND = 1  # Search failed high: true score >= value
+UPPER_BOUND = 2  # Search failed low: true score <= value
+
+class TranspositionTable:
+    """
+    Fixed-size hash table of search results with a bounded memory footprint.
+    Each bucket holds two slots: a depth-preferred slot that keeps the deepest
+    result seen, and an always-replace slot that keeps the most recent one.
+    """
+
+    # Approximate memory used by one stored entry (tuple plus its integers)
+    ENTRY_BYTES = 160
+
+    def __init__(self, max_mb=16):
+        """
+        Initialize an empty table sized to fit the given memory cap.
+
+        Args:
+            max_mb (float): Approximate memory cap in megabytes (default: 16)
+        """
+        buckets = max(1, int(max_mb * 1024 * 1024) // (2 * self.ENTRY_BYTES))
+        self.size = 1 << (buckets.bit_length() - 1)  # Round down to a power of two
+        self._index_mask = self.size - 1
+        self._deep = [None] * self.size
+        self._recent = [None] * self.size
+        self.hits = 0
+        self.stores = 0
+
+    def probe(self, key):
+        """
+        Look up a position in the table.
+
+        Args:
+            key (int): Zobrist hash of the position
+
+        Returns:
+            tuple: (key, depth, bound, value, move) entry, or None if not found
+        """
+        index = key & self._index_mask
+        entry = self._deep[index]
+        if entry is None or entry[0] != key:
+            entry = self._recent[index]
+            if entry is None or entry[0] != key:
+                return None
+        self.hits += 1
+        return entry
+
+    def store(self, key, depth, bound, value, move):
+        """
+        Store a search result, evicting according to the bucket replacement policy.
+
+        Args:
+            key (int): Zobrist hash of the position
+            depth (int): Remaining search depth the value was computed with
+            bound (int): EXACT, LOWER_BOUND or UPPER_BOUND
+            value (float): Search score
+            move (int): Best column found, or None
+        """
+        index = key & self._index_mask
+        entry = (key, depth, bound, value, move)
+        deep = self._deep[index]
+        if deep is None or deep[0] == key or depth >= deep[1]:
+            # Demote the previous deep entry instead of dropping it outright
+            if deep is not None and deep[0] != key:
+                self._recent[index] = deep
+            self._deep[index] = entry
+        else:
+            self._recent[index] = entry
+        self.stores += 1
+
+    def clear(self):
+        """
+        Remove all entries and reset the counters.
+        """
+        self._deep = [None] * self.size
+        self._recent = [None] * self.size
+        self.hits = 0
+        self.stores = 0
+
+# Field layout of a packed shared-table entry
+_VALUE_BITS = 32
+_VALUE_OFFSET = 1 << (_VALUE_BITS - 1)
+_DEPTH_SHIFT = 32
+_BOUND_SHIFT = 40
+_MOVE_SHIFT = 42
+_OCCUPIED = 1 << 63
+_WORD_MASK = (1 << 64) - 1
+
+class SharedTranspositionTable:
+    """
+    Transposition table in shared memory that several processes probe and store into.
+    Buckets follow the same two-slot policy as TranspositionTable. Each slot is
+    two 64-bit words, the key XOR the packed entry and the packed entry itself,
+    so writes need no lock: a slot torn by two concurrent writers no longer
+    matches its key and simply reads as a miss.
+
+    The creating process owns the memory and must call unlink() when done.
+    Instances pickle as a reference to the same memory, so they can be passed
+    to worker processes. The counters are kept per process.
+    """
+
+    # Bytes used by one slot (two 64-bit words)
+    ENTRY_BYTES = 16
+
+    def __init__(self, max_mb=16, name=None):
+        """
+        Create a new table, or attach to an existing one by name.
+
+        Args:
+            max_mb (float): Memory cap in megabytes for a new table (default: 16)
+            name (str): Shared memory block of an existing table to attach to
+        """
+        if name is None:
+            buckets = max(1, int(max_mb * 1024 * 1024) // (2 * self.ENTRY_BYTES))
+            size = 1 << (buckets.bit_length() - 1)  # Round down to a power of two
+            self._shm = shared_memory.SharedMemory(create=True, size=size * 2 * self.ENTRY_BYTES)
+            self._shm.buf[:] = bytes(self._shm.size)
+        else:
+            self._shm = shared_memory.SharedMemory(name=name)
+            size = self._shm.size // (2 * self.ENTRY_BYTES)
+        self.name = self._shm.name
+        self.size = size
+        self._index_mask = size - 1
+        # Words per bucket: deep slot (check, data) then recent slot (check, data)
+        self._words = self._shm.buf.cast("Q")
+        self.hits = 0
+        self.stores = 0
+        self.collisions = 0  # Probes that found another position in the bucket
+        self.overwrites = 0  # Stores that evicted another position
+
+    def __reduce__(self):
+        return (SharedTranspositionTable, (0, self.name))
+
+    @staticmethod
+    def _unpack(key, data):
+        """
+        Unpack a stored entry.
+
+        Args:
+            key (int): Key of the entry
+            data (int): Packed entry word
+
+        Returns:
+            tuple: (key, depth, bound, value, move)
+        """
+        value = (data & (_VALUE_OFFSET * 2 - 1)) - _VALUE_OFFSET
+        depth = (data >> _DEPTH_SHIFT) & 0xFF
+        bound = (data >> _BOUND_SHIFT) & 0x3
+        move = ((data >> _MOVE_SHIFT) & 0x1F) - 1
+        return (key, depth, bound, value, move if move >= 0 else None)
+
+    def probe(self, key):
+        """
+        Look up a position in the table.
+
+        Args:
+            key (int): Zobrist hash of the position
+
+        Returns:
+            tuple: (key, depth, bound, value, move) entry, or None if not found
+        """
+        words = self._words
+        base = (key & self._index_mask) * 4
+        for slot in (base, base + 2):
+            data = words[slot + 1]
+            if data and words[slot] ^ data == key:
+                self.hits += 1
+                return self._unpack(key, data)
+        if words[base + 1] or words[base + 3]:
+            self.collisions += 1
+        return None
+
+    def store(self, key, depth, bound, value, move):
+        """
+        Store a search result, evicting according to the bucket replacement policy.
+
+        Args:
+            key (int): Zobrist hash of the position
+            depth (int): Remaining search depth the value was computed with
+            bound (int): EXACT, LOWER_BOUND or UPPER_BOUND
+            value (int): Search score (must fit in 32 signed bits)
+            move (int): Best column found, or None
+        """
+        words = self._words
+        key &= _WORD_MASK
+        base = (key & self._index_mask) * 4
+        data = (_OCCUPIED | (int(value) + _VALUE_OFFSET)
+                | min(depth, 0xFF) << _DEPTH_SHIFT
+                | bound << _BOUND_SHIFT
+                | (move + 1 if move is not None else 0) << _MOVE_SHIFT)
+        deep_data = words[base + 1]
+        deep_key = words[base] ^ deep_data
+        if not deep_data or deep_key == key or depth >= (deep_data >> _DEPTH_SHIFT) & 0xFF:
+            # Demote the previous deep entry instead of dropping it outright
+            if deep_data and deep_key != key:
+                self._write(base + 2, deep_key, deep_data)
+            self._write(base, key, data)
+        else:
+            self._write(base + 2, key, data)
+        self.stores += 1
+
+    def _write(self, slot, key, data):
+        """
+        Write one slot, counting evictions of other positions.
+
+        Args:
+            slot (int): Word index of the slot
+            key (int): Key of the entry
+            data (int): Packed entry word
+        """
+        words = self._words
+        old = words[slot + 1]
+        if old and words[slot] ^ old != key:
+            self.overwrites += 1
+        words[slot] = key ^ data
+        words[slot + 1] = data
+
+    def clear(self):
+        """
+        Remove all entries and reset this process's counters.
+        """
+        self._shm.buf[:] = bytes(self._shm.size)
+        self.hits = 0
+        self.stores = 0
+        self.collisions = 0
+        self.overwrites = 0
+
+    def close(self):
+        """
+        Detach this process from the shared memory.
+        """
+        self._words.release()
+        self._shm.close()
+
+    def unlink(self):
+        """
+        Free the shared memory once every process has closed it.
+        """
+        self._shm.unlink()
@@ -2,6 +2,7 @@ import sys
 import pygame
 import time
 import os
+from collections import OrderedDict, deque
 from utils import *
 import pygame.gfxdraw
 
@@ -11,6 +12,139 @@ BOXING_FONT_PATH = os.path.join("fonts", "Boxing-Regular.otf")
 # At the top, define the TITLE_YELLOW color for reuse
 TITLE_YELLOW = (255, 255, 227)
 
+# Pre-rendered anti-aliased piece discs: radius -> {color: sprite}, least recently used radius first
+PIECE_SPRITES = OrderedDict()
+# Most radii kept at once; resizing the window leaves old sizes behind
+MAX_PIECE_SPRITE_SIZES = 8
+
+def get_piece_sprite(color, radius):
+    """
+    Get the anti-aliased disc of a piece, rendering it on first use.
+    The disc is drawn on a surface four times larger and scaled down, once
+    per color and radius. When more radii are cached than
+    MAX_PIECE_SPRITE_SIZES, the sprites of the least recently used radius
+    are dropped.
+
+    Args:
+        color (tuple): RGB color of the piece
+        radius (int): Radius of the disc in pixels
+
+    Returns:
+        pygame.Surface: Sprite of size 2 * (radius + 1) with the disc centered
+    """
+    sprites = PIECE_SPRITES.get(radius)
+    if sprites is None:
+        sprites = PIECE_SPRITES[radius] = {}
+        if len(PIECE_SPRITES) > MAX_PIECE_SPRITE_SIZES:
+            PIECE_SPRITES.popitem(last=False)
+    else:
+        PIECE_SPRITES.move_to_end(radius)
+    key = tuple(color)
+    sprite = sprites.get(key)
+    if sprite is None:
+        supersample = 4
+        size = 2 * (radius + 1)
+        big = pygame.Surface((size * supersample, size * supersample), pygame.SRCALPHA)
+        center = (radius + 1) * supersample
+        pygame.gfxdraw.filled_circle(big, center, center, radius * supersample, color)
+        pygame.gfxdraw.aacircle(big, center, center, radius * supersample, color)
+        sprite = pygame.transform.smoothscale(big, (size, size))
+        if pygame.display.get_surface() is not None:
+            sprite = sprite.convert_alpha()
+        sprites[key] = sprite
+    return sprite
+
+def blit_piece(surface, color, center, radius):
+    """
+    Draw a piece centered on a point from its cached sprite.
+
+    Args:
+        surface (pygame.Surface): Surface to draw on
+        color (tuple): RGB color of the piece
+        center (tuple): (x, y) center of the piece
+        radius (int): Radius of the disc in pixels
+    """
+    surface.blit(get_piece_sprite(color, radius), (int(center[0]) - radius - 1, int(center[1]) - radius - 1))
+
+# Longest an idle screen sleeps without any event, in milliseconds
+IDLE_FRAME_TIMEOUT = 500
+# Longest single sleep while an idle screen waits for an event, in milliseconds
+IDLE_POLL_INTERVAL = 10
+
+class FrameScheduler:
+    """
+    Paces the frame loops of every screen: animated frames are capped at the
+    frame rate, and idle screens sleep until an event arrives instead of
+    redrawing as fast as possible. Also keeps recent frame timings.
+    """
+
+    def __init__(self, fps=FPS, idle_timeout=IDLE_FRAME_TIMEOUT, history=120):
+        """
+        Create a scheduler.
+
+        Args:
+            fps (int): Frame rate cap
+            idle_timeout (int): Longest sleep of an idle frame in milliseconds
+            history (int): Number of recent frames kept for the timing figures
+        """
+        self.fps = fps
+        self.idle_timeout = idle_timeout
+        self.clock = pygame.time.Clock()
+        self.frame_times = deque(maxlen=history)  # Milliseconds from one frame to the next
+        self.work_times = deque(maxlen=history)   # Milliseconds spent on each frame before tick
+        self.idle_frames = 0
+        self._frame_start = time.perf_counter()
+
+    def tick(self, animating=True, timeout=None):
+        """
+        End a frame. Call once per loop iteration, after the display update.
+
+        Args:
+            animating (bool): True if the next frame should come at the capped
+                frame rate; False to sleep until an event arrives
+            timeout (int): Longest idle sleep in milliseconds (default: idle_timeout)
+        """
+        self.work_times.append((time.perf_counter() - self._frame_start) * 1000)
+        if not animating and not pygame.event.peek():
+            self.idle_frames += 1
+            wait = self.idle_timeout if timeout is None else timeout
+            deadline = pygame.time.get_ticks() + int(wait)
+            # Sleep in short slices and leave the queue to the caller's own event loop
+            while not pygame.event.peek():
+                remaining = deadline - pygame.time.get_ticks()
+                if remaining <= 0:
+                    break
+                pygame.time.wait(min(IDLE_POLL_INTERVAL, remaining))
+        # Also caps bursts of events, such as mouse motion, at the frame rate
+        self.clock.tick(self.fps)
+        now = time.perf_counter()
+        self.frame_times.append((now - self._frame_start) * 1000)
+        self._frame_start = now
+
+    @property
+    def frame_rate(self):
+        """
+        Frames per second over the recent frames.
+
+        Returns:
+            float: Measured frame rate (0 before the first frame)
+        """
+        total = sum(self.frame_times)
+        return len(self.frame_times) * 1000 / total if total else 0.0
+
+    @property
+    def average_work_time(self):
+        """
+        Average time the recent frames spent working rather than waiting.
+
+        Returns:
+            float: Milliseconds per frame (0 before the first frame)
+        """
+        return sum(self.work_times) / len(self.work_times) if self.work_times else 0.0
+
+# Shared by the menu and every game mode
+frame_scheduler = FrameScheduler()
+
 class LoadingScreen:
     def __init__(self, screen):
         self.screen = screen
@@ -113,22 +247,9 @@ class SpriteSelector:
         # Draw sprite name
         text = self.font.render(self.sprites[self.current_sprite], True, WHITE)
         self.screen.blit(text, (center_x - text.get_width() // 2, y + 10))
-        # Supersample the sprite preview circle
-        supersample = 4
-        preview_size = 80  # diameter of preview area
-        surf_size = preview_size * supersample
-        preview_surface = pygame.Surface((surf_size, surf_size), pygame.SRCALPHA)
-        sprite_color = self.get_sprite_color()
-        # Draw filled and antialiased circle to preview_surface
-        cx = surf_size // 2
-        cy = surf_size // 2
-        radius = 32 * supersample
-        pygame.gfxdraw.filled_circle(preview_surface, int(cx), int(cy), int(radius), sprite_color)
-        pygame.gfxdraw.aacircle(preview_surface, int(cx), int(cy), int(radius), sprite_color)
-        # Downscale and blit to screen
-        small_preview = pygame.transform.smoothscale(preview_surface, (preview_size, preview_size))
+        # Sprite preview piece
         piece_center_y = int(box_rect.centery + 20)
-        self.screen.blit(small_preview, (center_x - preview_size // 2, piece_center_y - preview_size // 2))
+        blit_piece(self.screen, self.get_sprite_color(), (center_x, piece_center_y), 32)
         # Draw navigation arrows (no bg, just white text, vertically aligned with the box)
         arrow_font = pygame.font.Font(BOXING_FONT_PATH, 48)
         left_arrow = arrow_font.render("<", True, WHITE)
@@ -172,7 +293,7 @@ class DifficultySelector:
         self.width = 300
         self.height = 40
         self.font = pygame.font.Font(BOXING_FONT_PATH, 24)
-        self.difficulties = ["easy", "medium", "hard", "ai_vs_ai", "user_vs_user"]
+        self.difficulties = ["easy", "medium", "hard", "perfect", "ai_vs_ai", "user_vs_user"]
         self.buttons = []
         
         button_width = self.width // 3
@@ -186,6 +307,9 @@ class DifficultySelector:
                 label = "User vs AI (Medium)"
             elif diff == "hard":
                 label = "User vs AI (Hard)"
+            elif diff == "perfect":
+                # Exact only once the solver finishes in time, usually from mid-game on
+                label = "User vs AI (Exact Endgame)"
             elif diff == "ai_vs_ai":
                 label = "AI vs AI"
             elif diff == "user_vs_user":
@@ -312,7 +436,6 @@ class GameMenu:
             pos (tuple): (x, y) position
             delay (int): Base delay between characters in milliseconds
         """
-        clock = pygame.time.Clock()
         for i in range(len(text) + 1):
             # Handle events during animation
             for event in pygame.event.get():
@@ -333,7 +456,7 @@ class GameMenu:
             
             # Update display
             pygame.display.flip()
-            clock.tick(60)
+            frame_scheduler.tick()
             
             # Variable delay based on character position
             if i < len(text):
@@ -351,7 +474,6 @@ class GameMenu:
             background (pygame.Surface): Background surface
             duration (int): Duration of fade in milliseconds
         """
-        clock = pygame.time.Clock()
         fade_surface = surface.copy()
         fade_surface.set_alpha(0)
         
@@ -378,7 +500,7 @@ class GameMenu:
             pygame.display.flip()
             
             # Maintain consistent frame rate
-            clock.tick(60)
+            frame_scheduler.tick()
         
         # Ensure final state is fully visible
         fade_surface.set_alpha(255)
@@ -390,7 +512,6 @@ class GameMenu:
         """
         Fade in the background from black to the title background with easing.
         """
-        clock = pygame.time.Clock()
         fade_surface = pygame.Surface((self.screen_width, self.screen_height))
         fade_surface.fill(BLACK)
         
@@ -416,7 +537,7 @@ class GameMenu:
             pygame.display.flip()
             
             # Maintain consistent frame rate
-            clock.tick(60)
+            frame_scheduler.tick()
             pygame.time.delay(5)  # Reduced delay for smoother animation
     
     def show_title_screen(self):
@@ -463,7 +584,6 @@ class GameMenu:
         self.fade_in_surface(credits_surface, credits_pos, self.bg_title1)
         
         # Animation loop
-        clock = pygame.time.Clock()
         scroll_x = 0
         waiting = True
         
@@ -494,7 +614,7 @@ class GameMenu:
             self.screen.blit(credits_surface, credits_pos)
             
             pygame.display.flip()
-            clock.tick(60)
+            frame_scheduler.tick()
 
     def show_name_input(self):
         name_input = ""
@@ -560,6 +680,8 @@ class GameMenu:
                 text_rect = text_surf.get_rect(center=next_button.rect.center)
                 self.screen.blit(text_surf, text_rect)
             pygame.display.update()
+            # Wake up in time for the next cursor blink
+            frame_scheduler.tick(animating=False, timeout=500 - pygame.time.get_ticks() % 500)
 
     def show_piece_selection(self):
         sprite_selector = SpriteSelector(self.screen, 0, 0)
@@ -624,6 +746,7 @@ class GameMenu:
             confirm_y = nav_y + button_height + 20
             self.screen.blit(confirm_text, (center_x - confirm_text.get_width() / 2, confirm_y))
             pygame.display.update()
+            frame_scheduler.tick(animating=False)
 
     def show_difficulty_selection(self):
         difficulty_selector = DifficultySelector(self.screen, 0, 0)
@@ -700,6 +823,7 @@ class GameMenu:
                 if event.type == pygame.KEYDOWN or event.type == pygame.MOUSEBUTTONDOWN:
                     viewing = False
             pygame.display.update()
+            frame_scheduler.tick(animating=False)
 
     def show_leaderboard(self):
         try:
@@ -780,6 +904,7 @@ class GameMenu:
             back_text = small_font.render("Press any key to return", True, LIGHT_GREY)
             self.screen.blit(back_text, (center_x - back_text.get_width() / 2, self.screen_height - 40 * scale_factor))
             pygame.display.update()
+            frame_scheduler.tick(animating=False)
 
     def show(self):
         # 1. Title screen
@@ -844,6 +969,18 @@ class GameUI:
             self.ai_color = YELLOW
         # Load background image for game (now bg4)
         self.bg_game = pygame.image.load(os.path.join("imgs", "bg4.jpg")).convert()
+        # Name of the AI whose move is being computed, or None
+        self.thinking = None
+        # Background, empty board and header bar, rendered once per window size
+        self.static_layer = None
+        self.static_layer_size = None
+        self.hovering = False  # True once the mouse has moved over the game
+        self.winner = None  # Winner announced by show_winner, drawn over the board by render
+        # What render last put on the display, so the next frame only updates what changed
+        self.drawn_screen = None
+        self.drawn_board = None
+        self.drawn_header = None
+        self.drawn_winner = None
     
     def update_layout(self):
         self.screen_width = self.screen.get_width()
@@ -861,9 +998,50 @@ class GameUI:
         return x_offset, y_offset
     
     def draw_board(self, board):
-        # Always draw the background image first
-        bg = pygame.transform.smoothscale(self.bg_game, (self.screen_width, self.screen_height))
-        self.screen.blit(bg, (0, 0))
+        # Full redraw: the cached static layer, every piece and the header labels
+        self.screen.blit(self.get_static_layer(), (0, 0))
+        for r in range(ROW_COUNT):
+            for c in range(COLUMN_COUNT):
+                self.draw_piece(board, r, c)
+        self.draw_labels()
+        if self.thinking:
+            self.draw_thinking()
+    
+    def cell_rect(self, r, c):
+        # Screen area covered by the piece in a cell
+        x_offset, y_offset = self.get_offsets()
+        radius = int(self.radius) + 2  # Slightly larger than the hole so it is fully covered
+        cx = int(x_offset + c * self.square_size + self.square_size / 2)
+        cy = int(y_offset + WINDOW_HEIGHT * self.scale_factor - r * self.square_size - self.square_size / 2)
+        return pygame.Rect(cx - radius - 1, cy - radius - 1, 2 * (radius + 1), 2 * (radius + 1))
+    
+    def draw_piece(self, board, r, c):
+        # Blit the piece in a cell, if any, over what is already on screen
+        if board[r][c] == PLAYER_PIECE:
+            color = self.player_color
+        elif board[r][c] == AI_PIECE:
+            color = self.ai_color
+        else:
+            return
+        rect = self.cell_rect(r, c)
+        self.screen.blit(get_piece_sprite(color, rect.width // 2 - 1), rect.topleft)
+    
+    def get_static_layer(self):
+        # Rebuilt only when the window size changes
+        self.update_layout()
+        size = (self.screen_width, self.screen_height)
+        if self.static_layer is None or self.static_layer_size != size:
+            self.static_layer = self.render_static_layer()
+            self.static_layer_size = size
+            # Render this size's pieces up front so the first move does not pay for them
+            for color in (self.player_color, self.ai_color):
+                get_piece_sprite(color, int(self.radius) + 2)
+                get_piece_sprite(color, int(self.radius))
+        return self.static_layer
+    
+    def render_static_layer(self):
+        # Background image, the board with its holes and the header bar
+        layer = pygame.transform.smoothscale(self.bg_game, (self.screen_width, self.screen_height))
         supersample = 4
         surf_w = int(self.screen_width * supersample)
         surf_h = int(self.screen_height * supersample)
@@ -872,7 +1050,6 @@ class GameUI:
         x_offset, y_offset = self.get_offsets()
         x_offset = int(x_offset * supersample)
         y_offset = int(y_offset * supersample)
-        scale_factor = self.scale_factor * supersample
         square_size = int(self.square_size * supersample)
         radius = int(self.radius * supersample)
         # Use a darker yellow/orange for the board
@@ -889,24 +1066,17 @@ class GameUI:
                 # Draw semi-transparent holes (tempered glass look, less transparent)
                 pygame.gfxdraw.filled_circle(board_surface, int(cx), int(cy), int(radius), (0, 0, 0, 180))
                 pygame.gfxdraw.aacircle(board_surface, int(cx), int(cy), int(radius), (0, 0, 0, 180))
-        for c in range(COLUMN_COUNT):
-            for r in range(ROW_COUNT):
-                cx = int(x_offset + c * square_size + square_size / 2)
-                cy = int(y_offset + WINDOW_HEIGHT * scale_factor - r * square_size - square_size / 2)
-                if board[r][c] == PLAYER_PIECE:
-                    # Increase piece size to fully cover the hole
-                    pygame.gfxdraw.filled_circle(board_surface, int(cx), int(cy), int(radius) + supersample * 2, self.player_color)
-                    pygame.gfxdraw.aacircle(board_surface, int(cx), int(cy), int(radius) + supersample * 2, self.player_color)
-                elif board[r][c] == AI_PIECE:
-                    pygame.gfxdraw.filled_circle(board_surface, int(cx), int(cy), int(radius) + supersample * 2, self.ai_color)
-                    pygame.gfxdraw.aacircle(board_surface, int(cx), int(cy), int(radius) + supersample * 2, self.ai_color)
         small_surface = pygame.transform.smoothscale(board_surface, (self.screen_width, self.screen_height))
-        self.screen.blit(small_surface, (0, 0))
+        layer.blit(small_surface, (0, 0))
         # Draw a semi-transparent black header bar at the top
         header_height = int(self.square_size)
         header_surface = pygame.Surface((self.screen_width, header_height), pygame.SRCALPHA)
         header_surface.fill((0, 0, 0, 180))
-        self.screen.blit(header_surface, (0, 0))
+        layer.blit(header_surface, (0, 0))
+        return layer
+    
+    def draw_labels(self):
+        # Player names in the header; not cached since User vs User switches names every turn
         x_offset, y_offset = self.get_offsets()
         if self.ai_vs_ai:
             ai1_text = self.font_small.render("AI 1", True, self.player_color)
@@ -917,26 +1087,95 @@ class GameUI:
             player_text = self.font_small.render(f"Player: {self.player_name}", True, self.player_color)
             self.screen.blit(player_text, (x_offset + 10, y_offset + 10))
     
+    def thinking_message(self):
+        # The dots animate so a long search shows the window is alive
+        if not self.thinking:
+            return None
+        return f"{self.thinking} is thinking" + "." * (pygame.time.get_ticks() // THINKING_DOT_INTERVAL % 4)
+    
+    def draw_thinking(self):
+        # Centered in the header, positioned as if all three dots were shown so the text does not jump
+        x_offset, y_offset = self.get_offsets()
+        message = self.thinking_message()
+        full_width = self.font_small.size(f"{self.thinking} is thinking...")[0]
+        text = self.font_small.render(message, True, LIGHT_GREY)
+        self.screen.blit(text, (x_offset + (WINDOW_WIDTH * self.scale_factor - full_width) // 2, y_offset + 10))
+    
+    def header_rect(self):
+        # Everything above the top row of the board: header bar, labels, hover piece and score
+        x_offset, y_offset = self.get_offsets()
+        return pygame.Rect(0, 0, self.screen_width, int(y_offset + self.square_size))
+    
+    def draw_header(self, score):
+        # Restore the header from the static layer, then draw its changing parts
+        rect = self.header_rect()
+        self.screen.blit(self.get_static_layer(), rect.topleft, rect)
+        self.draw_labels()
+        if self.hovering and self.winner is None:
+            x_offset, y_offset = self.get_offsets()
+            blit_piece(self.screen, self.player_color,
+                       (x_offset + self.hover_col * self.square_size + self.square_size//2,
+                        y_offset + self.square_size//2),
+                       int(self.radius))
+        if self.thinking:
+            self.draw_thinking()
+        self.draw_score(score)
+    
     def update_hover(self, x_pos):
-        # Calculate centering offsets
+        # Only track the column under the mouse; render draws the hover piece
         x_offset, y_offset = self.get_offsets()
-        # Adjust x_pos for offset
         adjusted_x_pos = x_pos - x_offset
-        # Show piece hover effect
-        header_surface = pygame.Surface((self.screen_width, int(self.square_size)), pygame.SRCALPHA)
-        header_surface.fill((0, 0, 0, 180))
-        self.screen.blit(header_surface, (0, 0))
-        # Draw player info and score again (since we cleared the top)
-        player_text = self.font_small.render(f"Player: {self.player_name}", True, self.player_color)
-        self.screen.blit(player_text, (x_offset + 10, y_offset + 10))
-        # Calculate column from x position
         self.hover_col = min(max(int(adjusted_x_pos // self.square_size), 0), COLUMN_COUNT - 1)
-        # Draw hover piece
-        pygame.draw.circle(self.screen, self.player_color, 
-                          (x_offset + self.hover_col * self.square_size + self.square_size//2, 
-                           y_offset + self.square_size//2), 
-                          int(self.radius))
-        pygame.display.update()
+        self.hovering = True
+    
+    def invalidate(self):
+        # Make the next render redraw the whole screen
+        self.drawn_screen = None
+    
+    def render(self, board, score):
+        # Draw one game frame, sending only the regions that changed to the display.
+        # The whole screen is redrawn after a resize, a new display surface or invalidate().
+        self.get_static_layer()
+        header = (self.player_name, self.hover_col if self.hovering and self.winner is None else None,
+                  self.thinking_message(), repr(score))
+        if self.drawn_screen is not self.screen or self.drawn_board is None or \
+                self.static_layer_size != self.screen.get_size():
+            self.draw_board(board)
+            self.draw_header(score)
+            if self.winner is not None:
+                self.draw_winner()
+            pygame.display.update()
+        else:
+            dirty = []
+            for r in range(ROW_COUNT):
+                for c in range(COLUMN_COUNT):
+                    if board[r][c] != self.drawn_board[r][c]:
+                        rect = self.cell_rect(r, c)
+                        self.screen.blit(self.static_layer, rect.topleft, rect)
+                        self.draw_piece(board, r, c)
+                        dirty.append(rect)
+            if header != self.drawn_header:
+                self.draw_header(score)
+                dirty.append(self.header_rect())
+            if self.winner is not None:
+                rect = self.winner_rect()
+                if self.winner != self.drawn_winner or rect.collidelist(dirty) != -1:
+                    # Rebuild the announcement's area so its translucent background is not blended twice
+                    self.screen.set_clip(rect)
+                    self.screen.blit(self.static_layer, rect.topleft, rect)
+                    for r in range(ROW_COUNT):
+                        for c in range(COLUMN_COUNT):
+                            if self.cell_rect(r, c).colliderect(rect):
+                                self.draw_piece(board, r, c)
+                    self.draw_winner()
+                    self.screen.set_clip(None)
+                    dirty.append(rect)
+            if dirty:
+                pygame.display.update(dirty)
+        self.drawn_screen = self.screen
+        self.drawn_board = [[board[r][c] for c in range(COLUMN_COUNT)] for r in range(ROW_COUNT)]
+        self.drawn_header = header
+        self.drawn_winner = self.winner
     
     def draw_score(self, score):
         # Calculate centering offsets
@@ -964,6 +1203,29 @@ class GameUI:
             self.screen.blit(score_text, (x_offset + WINDOW_WIDTH * self.scale_factor - score_text.get_width() - 10, y_offset + 10))
     
     def show_winner(self, winner):
+        # Announced over the board by the next render
+        self.winner = winner
+    
+    def winner_label(self):
+        # Text and color of the announcement
+        if self.winner == "AI":
+            return "AI wins!", self.ai_color
+        elif self.winner == "Draw":
+            return "game is a Draw!", WHITE
+        return f"{self.winner} wins!", self.player_color
+    
+    def winner_rect(self):
+        # Screen area covered by the announcement's background and text
+        x_offset, y_offset = self.get_offsets()
+        label_width, label_height = self.font.size(self.winner_label()[0])
+        center_x = x_offset + WINDOW_WIDTH * self.scale_factor//2
+        center_y = y_offset + WINDOW_HEIGHT * self.scale_factor//2
+        bg_rect = pygame.Rect(center_x - 200 * self.scale_factor, center_y - 40 * self.scale_factor,
+                              400 * self.scale_factor, 80 * self.scale_factor)
+        label_rect = pygame.Rect(center_x - label_width//2, center_y - label_height//2, label_width, label_height)
+        return bg_rect.union(label_rect)
+    
+    def draw_winner(self):
         # Calculate centering offsets
         x_offset, y_offset = self.get_offsets()
         
@@ -971,18 +1233,13 @@ class GameUI:
         label_bg.set_alpha(200)  # Semi-transparent
         label_bg.fill(BLACK)
         
-        if winner == "AI":
-            label = self.font.render("AI wins!", True, self.ai_color)
-        elif winner == "Draw":
-            label = self.font.render("game is a Draw!", True, WHITE)
-        else:
-            label = self.font.render(f"{winner} wins!", True, self.player_color)
+        text, color = self.winner_label()
+        label = self.font.render(text, True, color)
         
         self.screen.blit(label_bg, (x_offset + WINDOW_WIDTH * self.scale_factor//2 - 200 * self.scale_factor, 
                                    y_offset + WINDOW_HEIGHT * self.scale_factor//2 - 40 * self.scale_factor))
         self.screen.blit(label, (x_offset + WINDOW_WIDTH * self.scale_factor//2 - label.get_width()//2, 
                                 y_offset + WINDOW_HEIGHT * self.scale_factor//2 - label.get_height()//2))
-        pygame.display.update()
 
     def blit_centered_bg(self, img, screen):
         img_w, img_h = img.get_size()
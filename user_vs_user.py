@@ -7,7 +7,7 @@ import pygame
 import sys
 import datetime
 from board import Board
-from ui import GameUI, Button, GameMenu, BOXING_FONT_PATH
+from ui import GameUI, Button, GameMenu, BOXING_FONT_PATH, frame_scheduler
 from utils import *
 from ui import SpriteSelector
 
@@ -110,6 +110,7 @@ class UserVsUserGame:
                         player1_color = sprite_selector1.get_selected_sprite()
                         done = True
                 pygame.display.update()
+                frame_scheduler.tick(animating=False)
             if done:
                 break
         # Second player
@@ -185,6 +186,7 @@ class UserVsUserGame:
                         player2_color = sprite_selector2.get_selected_sprite()
                         done = True
                 pygame.display.update()
+                frame_scheduler.tick(animating=False)
             if done:
                 break
         self.player1_color = player1_color
@@ -284,6 +286,7 @@ class UserVsUserGame:
             back_text = small_font.render("Press any key to return", True, LIGHT_GREY)
             self.screen.blit(back_text, (center_x - back_text.get_width() / 2, self.screen_height - 40 * scale_factor))
             pygame.display.update()
+            frame_scheduler.tick(animating=False)
 
     def run(self):
         """
@@ -294,6 +297,8 @@ class UserVsUserGame:
         from ui import Button
         self.prompt_names()
         self.ui.player_name = self.player1_name
+        # The name prompts drew over the game; the first render redraws everything
+        self.ui.invalidate()
         started = True
         while True:
             for event in pygame.event.get():
@@ -308,6 +313,10 @@ class UserVsUserGame:
                     self.ui.screen_width = event.w
                     self.ui.screen_height = event.h
                     self.ui.update_layout()
+                    self.ui.invalidate()
+                if event.type == pygame.WINDOWEXPOSED:
+                    # Part of the window was uncovered; redraw all of it on the next render
+                    self.ui.invalidate()
                 if self.game_over:
                     continue
                 if event.type == pygame.MOUSEMOTION:
@@ -337,7 +346,7 @@ class UserVsUserGame:
                                 self.game_over = True
                                 self.ui.show_winner(self.player1_name if self.turn == 0 else self.player2_name)
                                 continue
-                            elif len(self.board.get_valid_locations()) == 0:
+                            elif self.board.is_full():
                                 self.player1_score = 50
                                 self.player2_score = 50
                                 self.game_over = True
@@ -345,12 +354,12 @@ class UserVsUserGame:
                                 continue
                             self.turn = 1 - self.turn
                             self.ui.player_name = self.player1_name if self.turn == 0 else self.player2_name
-            self.ui.draw_board(self.board.board)
-            self.ui.draw_score((self.player1_score, self.player2_score, self.player1_name, self.player2_name, self.player1_color, self.player2_color))
+            # Send only what changed since the last frame to the display
+            self.ui.render(self.board.board, (self.player1_score, self.player2_score, self.player1_name, self.player2_name, self.player1_color, self.player2_color))
             if self.game_over:
                 # Log result to leaderboard with timestamp, move count, and winner
                 now = datetime.datetime.now().strftime('%Y-%m-%d %H:%M')
-                total_moves = sum(1 for row in self.board.board.flatten() if row != 0)
+                total_moves = self.board.move_count
                 if self.player1_score > self.player2_score:
                     winner = self.player1_name
                     result_entry = f"[{now}] Winner: {self.player1_name} | Moves: {total_moves} | {self.player1_name}: {self.player1_score}, {self.player2_name}: {self.player2_score}"
@@ -425,7 +434,10 @@ class UserVsUserGame:
                     leaderboard_button.draw()
                     menu_button.draw()
                     pygame.display.update()
+                    frame_scheduler.tick(animating=False)
                 # Return to menu
                 current_w, current_h = self.screen.get_size()
                 menu = GameMenu(self.screen, current_w, current_h)
-                return menu.show() 
\ No newline at end of file
+                return menu.show() 
+            # Two-player games only change on input, so sleep until there is some
+            frame_scheduler.tick(animating=False)
@@ -27,6 +27,8 @@ RADIUS = int(SQUARESIZE/2 - 5)  # Radius of game pieces
 WINDOW_WIDTH = COLUMN_COUNT * SQUARESIZE    # Default window width
 WINDOW_HEIGHT = (ROW_COUNT + 1) * SQUARESIZE  # Default window height
 FPS = 60                   # Frames per second for game animation
+AI_MOVE_DELAY = 1200       # Pause between moves in AI vs AI mode, in milliseconds
+THINKING_DOT_INTERVAL = 400  # Milliseconds between steps of the "is thinking..." animation
 
 # Game state constants
 EMPTY = 0                  # Empty board position